@@ -1,21 +1,246 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import plotly.express as px
-from streamlit_lottie import st_lottie
+import plotly.graph_objects as go
 import requests
+import hashlib
+import heapq
+import html
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements
+    orjson = None
 # from dotenv import load_dotenv  #Changed for deployment on streamlit
 # load_dotenv()
 
+
+def _dumps_payload(payload):
+    """
+    Serialize a results payload to a canonical JSON string.
+
+    Used as the cache key for the summary-report helpers, so key order must
+    be stable. orjson is several times faster than json on the large nested
+    gene/resistance dicts; json is the fallback if orjson is unavailable.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            payload, option=orjson.OPT_SORT_KEYS, default=str
+        ).decode()
+    return json.dumps(payload, sort_keys=True, default=str)
+
+
+def _loads_payload(payload_json):
+    """Deserialize a payload produced by _dumps_payload."""
+    if orjson is not None:
+        return orjson.loads(payload_json)
+    return json.loads(payload_json)
+
+# Static empty-state messages for the results tabs - built once at import
+# time instead of per rerun
+EMPTY_RESULTS_MSG = "No results yet. Run an analysis to see predicted genes, proteins and recommendations here."
+EMPTY_GENES_MSG = "No AMR genes were detected in the sequence."
+EMPTY_PROTEINS_MSG = "No protein sequences were generated."
+EMPTY_RESISTANCE_MSG = "No resistance markers were detected."
+EMPTY_RECOMMENDATIONS_MSG = "No antibiotic recommendations were generated."
+EMPTY_BLAST_HITS_MSG = "No BLAST hits found. Try lowering the significance threshold or use a different sequence."
+EMPTY_BLAST_MSG = "No BLAST results available. Run the analysis with BLAST search enabled to see results here."
+
+# Rows of the BLAST hits table rendered by default; the rest sit behind an
+# expander so the large payload is only serialized on demand
+MAX_HITS_TABLE_ROWS = 200
+
+# Characters of the summary report rendered by default; longer reports get
+# a "Show full report" button since browser-side markdown parsing is the
+# slow path on multi-KB inputs
+MAX_REPORT_CHARS = 4000
+
+# Sample GI IDs used for the organism-identification demo in the genes tab
+# (these would normally come from the sequence data); module-level so the
+# list isn't rebuilt on every fragment rerun
+_SAMPLE_GI_IDS = (
+    "gi|2949256985|gb|PV357209.1|",
+    "gi|2955779261|gb|CP186947.1|",
+    "gi|2907303961|gb|CP180162.1|",
+    "gi|2944053110|gb|CP185129.1|",
+    "gi|2944072299|gb|CP185207.1|",
+    "gi|2957198048|gb|CP187245.1|",
+    "gi|2936382141|gb|CP127996.1|",
+    "gi|2929938784|gb|CP184032.1|",
+    "gi|2955378441|gb|CP186876.1|",
+    "gi|2944049663|gb|CP185092.1|",
+)
+
+# Static page copy, built once at import instead of re-assembled inside
+# main() on every rerun. Grouped by page: the pre-analysis landing page,
+# then the home page shown before any analysis has run.
+_LANDING_HERO_HTML = """
+<style>
+[data-testid="stSidebar"] {
+    display: none;
+}
+</style>
+<div style="text-align: center; margin-top: 10px;">
+    <h1 style="color: #0d47a1; font-size: 3.5rem; margin-bottom: 10px; font-weight: 700;">GeneHack AMR</h1>
+    <p style="color: #424242; font-size: 1.5rem; margin-bottom: 30px;">Revolutionizing Antimicrobial Resistance Analysis</p>
+</div>
+"""
+
+_LANDING_INTRO_HTML = """
+<div style="background-color: #f0f7ff; padding: 25px; border-radius: 10px; margin: 20px 0; box-shadow: 0 4px 12px rgba(0,0,0,0.08); border-left: 5px solid #1976d2;">
+    <h2 style="color: #0d47a1; margin-top: 0;">Docathon Collaboration Project</h2>
+    <p style="color: #424242; font-size: 1.1rem; line-height: 1.6;">
+        GeneHack AMR is a groundbreaking tool developed during the Docathon - an innovative hackathon bringing together
+        healthcare professionals and software engineers to solve critical medical challenges. This tool emerged from
+        the collaboration between doctors with expertise in infectious diseases and engineers skilled in genomic analysis and AI.
+    </p>
+</div>
+<h2 style='color: #0d47a1; text-align: center; margin: 40px 0 30px;'>Key Features</h2>
+<div style="display: flex; gap: 20px;">
+    <div style="flex: 1; background-color: white; padding: 20px; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.05); border: 1px solid #e0e0e0;">
+        <h3 style="color: #1976d2; font-size: 1.3rem;">🧬 Genomic Analysis</h3>
+        <p style="color: #616161;">Identify antimicrobial resistance genes in bacterial genomes with precision using advanced BLAST technology.</p>
+    </div>
+    <div style="flex: 1; background-color: white; padding: 20px; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.05); border: 1px solid #e0e0e0;">
+        <h3 style="color: #1976d2; font-size: 1.3rem;">💊 Antibiotic Recommendations</h3>
+        <p style="color: #616161;">Receive data-driven guidance on effective antibiotics based on the resistance profile of analyzed bacteria.</p>
+    </div>
+    <div style="flex: 1; background-color: white; padding: 20px; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.05); border: 1px solid #e0e0e0;">
+        <h3 style="color: #1976d2; font-size: 1.3rem;">🔬 Interactive Visualizations</h3>
+        <p style="color: #616161;">Explore resistance markers, protein structures, and antibiotic effectiveness through intuitive visual interfaces.</p>
+    </div>
+</div>
+<h2 style='color: #0d47a1; text-align: center; margin: 40px 0 30px;'>Interdisciplinary Team</h2>
+"""
+
+_TEAM_MEDICAL_HTML = """
+<div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; text-align: center;">
+    <h3 style="color: #1565c0; margin-top: 0;">Medical Professionals</h3>
+    <p style="color: #424242;">Infectious disease specialists contributing clinical expertise on antimicrobial resistance mechanisms and treatment protocols.</p>
+</div>
+"""
+
+_TEAM_ENGINEERS_HTML = """
+<div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; text-align: center;">
+    <h3 style="color: #1565c0; margin-top: 0;">Software Engineers</h3>
+    <p style="color: #424242;">Bioinformatics and AI specialists building the computational infrastructure for genetic analysis and data visualization.</p>
+</div>
+"""
+
+_IMPACT_HTML = """
+<div style="background-color: #e8f5e9; padding: 25px; border-radius: 10px; margin: 40px 0 30px; box-shadow: 0 4px 12px rgba(0,0,0,0.08); border-left: 5px solid #43a047;">
+    <h2 style="color: #2e7d32; margin-top: 0;">Healthcare Impact</h2>
+    <p style="color: #424242; font-size: 1.1rem; line-height: 1.6;">
+        Antimicrobial resistance is one of the top 10 global public health threats facing humanity according to the WHO.
+        GeneHack AMR empowers healthcare providers with rapid bacterial genome analysis to choose effective antibiotics,
+        leading to better patient outcomes, reduced treatment failures, and slower development of resistance.
+    </p>
+</div>
+"""
+
+_LANDING_FOOTER_HTML = """
+<div style="text-align: center; margin-top: 60px; padding-top: 20px; border-top: 1px solid #e0e0e0;">
+    <p style="color: #9e9e9e; font-size: 0.9rem;">
+        © 2025 GeneHack AMR | Developed during Docathon | Streamlit Powered
+    </p>
+</div>
+"""
+
+_HOME_HERO_HTML = """
+<div style="text-align: center; padding: 20px 0;">
+    <h1 style="color: #1976d2; font-size: 2.8rem; margin-bottom: 10px;">GeneHack AMR</h1>
+    <p style="color: #666; font-size: 1.2rem; margin-bottom: 25px;">Advanced Antimicrobial Resistance Analysis Platform</p>
+</div>
+"""
+
+_HOME_FEATURES_HTML = """
+<div style="background-color: #f8f9fa; border-radius: 10px; padding: 20px; margin: 20px 0; border-left: 5px solid #1976d2;">
+    <h3 style="color: #1976d2; margin-top: 0;">Getting Started</h3>
+    <p>Upload a FASTA file or enter a raw genetic sequence in the sidebar and click 'Analyze Sequence' to start your analysis.</p>
+</div>
+<h2 style='text-align: center; color: #333; margin: 30px 0 20px;'>Key Features</h2>
+<div style="display: flex; gap: 20px;">
+    <div style="flex: 1; background-color: white; border-radius: 8px; padding: 15px; height: 200px; border: 1px solid #e0e0e0; box-shadow: 0 2px 4px rgba(0,0,0,0.05);">
+        <h3 style="color: #1976d2;">🧬 Gene Prediction</h3>
+        <p>Identifies genes linked to antimicrobial resistance with organism identification.</p>
+    </div>
+    <div style="flex: 1; background-color: white; border-radius: 8px; padding: 15px; height: 200px; border: 1px solid #e0e0e0; box-shadow: 0 2px 4px rgba(0,0,0,0.05);">
+        <h3 style="color: #1976d2;">🧪 Protein Analysis</h3>
+        <p>Converts genes to protein sequences and provides detailed domain analysis.</p>
+    </div>
+    <div style="flex: 1; background-color: white; border-radius: 8px; padding: 15px; height: 200px; border: 1px solid #e0e0e0; box-shadow: 0 2px 4px rgba(0,0,0,0.05);">
+        <h3 style="color: #1976d2;">💊 Antibiotic Recommendations</h3>
+        <p>Suggests which antibiotics might be effective based on the resistance profile.</p>
+    </div>
+</div>
+"""
+
+_QUICK_START_MD = """
+<div style="background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 6px rgba(0,0,0,0.1);">
+    <h3 style="color: #1976d2; margin-top: 0;">Quick Start Guide</h3>
+</div>
+
+1. **Select input method** in the sidebar: Upload FASTA, paste raw sequence, or load saved
+2. **Click 'Analyze Sequence'** to process the genomic data
+3. **Review results** across the interactive tabs
+
+<div style="background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 6px rgba(0,0,0,0.1); margin-top: 15px;">
+    <h4 style="color: #1976d2; margin-top: 0;">Results Breakdown</h4>
+</div>
+
+- 🧫 **Predicted Genes** - AMR genes with organism identification
+- 🔬 **Protein Sequences** - Translated proteins with domain analysis
+- 💊 **Antibiotic Recommendations** - Effective treatment options
+- 🔍 **BLAST Results** - Detailed gene matches from databases
+
+<div style="background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 6px rgba(0,0,0,0.1); margin-top: 15px;">
+    <h4 style="color: #1976d2; margin-top: 0;">Key Capabilities</h4>
+</div>
+
+- **Advanced Organism Identification** - Identifies bacterial species from sequence IDs
+- **Resistance Pattern Analysis** - Detects patterns of antimicrobial resistance
+- **Treatment Guidance** - Provides evidence-based antibiotic recommendations
+- **Interactive Visualizations** - Helps understand complex genomic data
+"""
+
+# Custom CSS with medical theme lives in assets/theme.css; the cached
+# loader reads it once per process
+@st.cache_resource(show_spinner=False)
+def load_app_css():
+    """Read the app stylesheet once per process."""
+    with open(os.path.join(os.path.dirname(__file__), 'assets', 'theme.css')) as f:
+        return f.read()
+
+# Single-worker pool for background database writes - one save at a time is
+# plenty and keeps the inserts ordered
+SAVE_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+# Shared session for animation downloads - reuses the TLS connection to the
+# CDN across the eight fetches instead of a fresh handshake per file
+LOTTIE_SESSION = requests.Session()
+
+# Worker pool for BLAST-backed pipeline runs, so the script thread can keep
+# updating the status widget while the search is in flight
+BLAST_POOL = ThreadPoolExecutor(max_workers=2)
+
 def main():
     # Import custom modules
+    from streamlit_lottie import st_lottie
     from data.database import (
         create_tables, save_analysis_result, get_analysis_result,
         get_analysis_history, save_sequence_data, get_sequence_data, 
         get_stored_sequences
     )
     from utils.sequence_processor import (
-        validate_sequence, parse_fasta, predict_amr_genes, translate_to_protein
+        SequenceHandle, validate_sequence, parse_fasta, parse_fasta_bytes,
+        predict_amr_genes, translate_to_protein, translate_to_proteins_batch
     )
     from utils.blast_search import search_amr_database
     from utils.resistance_predictor import (
@@ -29,15 +254,410 @@ def main():
         chat_with_assistant, generate_analysis_suggestions
     )
     from utils.openai_helper import generate_summary_report, generate_basic_report
-    from utils.enhanced_visualizations import (
-        create_resistance_frequency_bar_chart, create_resistance_level_pie_chart,
-        create_antibiotic_resistance_count_chart, create_resistance_mechanism_donut,
-        create_3d_gene_clustering, create_3d_protein_comparison
-    )
     from utils.sequence_identifier import get_organism_mapping, identify_organism_from_accession
-    
-    # Create database tables if they don't exist
-    create_tables()
+
+    # Cached figure builders - Streamlit reruns the whole script on every widget
+    # interaction, so building Plotly figures inline pays the full construction
+    # cost each time. These wrappers memoize the figures on their input data.
+    @st.cache_data(show_spinner=False)
+    def build_gene_plot(genes):
+        """Build (or fetch cached) gene location figure."""
+        return create_gene_visualization(genes)
+
+    @st.cache_data(show_spinner=False)
+    def build_protein_domain_plot(proteins):
+        """Build (or fetch cached) protein domain figure."""
+        return create_protein_domain_plot(proteins)
+
+    @st.cache_data(show_spinner=False)
+    def build_resistance_heatmap(resistance_data):
+        """Build (or fetch cached) resistance heatmap figure."""
+        return create_resistance_heatmap(resistance_data)
+
+    @st.cache_data(show_spinner=False)
+    def build_confidence_bar(records, title, colorscale):
+        """Build (or fetch cached) antibiotic confidence bar chart.
+
+        Uses go.Bar directly - plotly.express pays a large figure-assembly
+        overhead for what is a single-trace chart.
+        """
+        df = pd.DataFrame(records)
+        fig = go.Figure(go.Bar(
+            x=df['antibiotic'],
+            y=df['confidence'],
+            marker=dict(color=df['confidence'], colorscale=colorscale, showscale=True),
+        ))
+        fig.update_layout(
+            title=title,
+            xaxis_title='Antibiotic',
+            yaxis_title='Confidence Score (0-1)',
+        )
+        return fig
+
+    @st.cache_data(show_spinner="Parsing FASTA…")
+    def parse_fasta_cached(file_bytes):
+        """Parse uploaded FASTA bytes, memoized on the file content.
+
+        Without this every rerun after an upload re-parses the whole file;
+        with it the parse runs once per distinct upload. Parsing works on
+        the raw bytes - only headers are decoded.
+        """
+        return parse_fasta_bytes(file_bytes)
+
+    @st.cache_data(show_spinner=False)
+    def run_pipeline(sequence, sequence_name, use_blast, max_hits=500):
+        """Run the full analysis pipeline for a sequence.
+
+        Keyed on the sequence, its name and the BLAST flag, so re-analyzing
+        an identical input returns the memoized results instantly instead of
+        re-running BLAST / gene prediction / translation / resistance
+        analysis. Summary generation stays outside so the OpenAI call can be
+        retried independently. max_hits bounds how many BLAST hits are
+        post-processed - the UI only surfaces a subset anyway, and keeping
+        every hit for a large genome bloats session state.
+        """
+        blast_results = {}
+
+        # One shared handle: per-gene slices below are cheap bytes copies of
+        # just the gene region instead of str slices of a megabase genome
+        handle = SequenceHandle(sequence)
+        seq_bytes = handle.b
+
+        if use_blast:
+            # Approach 1: Use BLAST search for more accurate results
+            blast_results = search_amr_database(
+                sequence=sequence,
+                sequence_name=sequence_name
+            )
+
+            # Keep only the strongest hits before any post-processing.
+            # heapq.nlargest is O(N log max_hits) over the raw hit list,
+            # and everything downstream (gene records, translation,
+            # session state) scales with max_hits instead of N.
+            all_hits = blast_results.get('all_hits', [])
+            if len(all_hits) > max_hits:
+                all_hits = heapq.nlargest(max_hits, all_hits, key=itemgetter('identity'))
+                blast_results = dict(blast_results, all_hits=all_hits)
+            hits_by_class = blast_results.get('hits_by_class', {})
+            if any(len(hits) > max_hits for hits in hits_by_class.values()):
+                hits_by_class = {
+                    class_name: heapq.nlargest(max_hits, hits, key=itemgetter('identity'))
+                    if len(hits) > max_hits else hits
+                    for class_name, hits in hits_by_class.items()
+                }
+                blast_results = dict(blast_results, hits_by_class=hits_by_class)
+
+            # Convert BLAST hits to gene predictions columnar-ly: one
+            # DataFrame over the hit records with vectorized renames and
+            # string ops instead of a dict built per hit
+            if all_hits:
+                genes_df = pd.DataFrame.from_records(all_hits)[
+                    ['title', 'query_start', 'query_end', 'identity', 'e_value']
+                ].rename(columns={
+                    'title': 'description',
+                    'query_start': 'start_pos',
+                    'query_end': 'end_pos',
+                    'identity': 'confidence',
+                })
+                genes_df['id'] = 'BLAST_' + pd.Series(
+                    np.arange(1, len(genes_df) + 1), index=genes_df.index
+                ).astype(str)
+                # First word of hit title
+                genes_df['name'] = genes_df['description'].str.split(n=1).str[0]
+                genes_df['sequence_name'] = sequence_name
+                genes = genes_df.to_dict('records')
+            else:
+                genes = []
+
+            # Extract resistance data from BLAST results. The hits are
+            # flattened once and the High/Moderate/Low bucketing is done
+            # with np.select instead of per-hit Python branches.
+            flat_hits = [
+                (class_name, hit)
+                for class_name, hits in blast_results.get('hits_by_class', {}).items()
+                for hit in hits
+            ]
+            if flat_hits:
+                identities = np.fromiter(
+                    (hit['identity'] for _, hit in flat_hits),
+                    dtype=np.float64, count=len(flat_hits)
+                )
+                levels = np.select(
+                    [identities > 0.9, identities > 0.8],
+                    ['High', 'Moderate'], default='Low'
+                )
+                resistance_data = pd.DataFrame({
+                    'sequence_name': sequence_name,
+                    'gene_name': [hit['title'].split(maxsplit=1)[0] for _, hit in flat_hits],
+                    'gene_id': [hit['accession'] for _, hit in flat_hits],
+                    'antibiotic': [class_name.replace('_', ' ').title() for class_name, _ in flat_hits],
+                    'resistance_level': levels,
+                    'mechanism': [hit.get('mechanism', 'Unknown') for _, hit in flat_hits],
+                    'confidence': identities,
+                }).to_dict('records')
+            else:
+                resistance_data = []
+
+            # Set recommendations from BLAST results
+            recommendations = [{
+                'antibiotic': antibiotic,
+                'effective': data['effective'],
+                'confidence': data['confidence'],
+                'rationale': data['rationale']
+            } for antibiotic, data in blast_results.get('antibiotic_effectiveness', {}).items()]
+
+            # Generate protein sequences from genes with position info,
+            # translating the whole batch over one shared codon table
+            translatable = [g for g in genes if 'start_pos' in g and 'end_pos' in g]
+            gene_seqs = [
+                # 1-based to 0-based
+                seq_bytes[max(0, g['start_pos'] - 1):min(len(seq_bytes), g['end_pos'])]
+                for g in translatable
+            ]
+            protein_seqs = translate_to_proteins_batch(gene_seqs)
+            proteins = [{
+                'sequence_name': gene['sequence_name'],
+                'gene_id': gene['id'],
+                'gene_name': gene['name'],
+                'protein_sequence': protein_seq,
+                'length': len(protein_seq),
+                'domains': gene.get('domains', []),
+                'functions': gene.get('functions', [])
+            } for gene, protein_seq in zip(translatable, protein_seqs)]
+        else:
+            # Approach 2: Use built-in prediction methods (fallback)
+            # 1. Predict AMR genes
+            genes = predict_amr_genes(
+                sequence=sequence,
+                sequence_name=sequence_name
+            )
+
+            # 2. Generate protein sequences (batch translation)
+            gene_seqs = [seq_bytes[g['start_pos']:g['end_pos']] for g in genes]
+            protein_seqs = translate_to_proteins_batch(gene_seqs)
+            proteins = [{
+                'sequence_name': gene['sequence_name'],
+                'gene_id': gene['id'],
+                'gene_name': gene['name'],
+                'protein_sequence': protein_seq,
+                'length': len(protein_seq),
+                'domains': gene.get('domains', []),
+                'functions': gene.get('functions', [])
+            } for gene, protein_seq in zip(genes, protein_seqs)]
+
+            # 3. Analyze resistance
+            resistance_data = []
+            for protein in proteins:
+                # Analyze protein for resistance markers
+                resistance_results = analyze_protein_resistance(
+                    protein['protein_sequence'],
+                    protein['gene_name']
+                )
+
+                # Add sequence/gene annotations to resistance data - the
+                # resistance tab and heatmap key on gene_name
+                for r in resistance_results:
+                    r['sequence_name'] = protein['sequence_name']
+                    r['gene_id'] = protein['gene_id']
+                    r['gene_name'] = protein['gene_name']
+
+                resistance_data.extend(resistance_results)
+
+            # 4. Generate recommendations
+            recommendations = get_antibiotic_recommendations(resistance_data)
+
+        return {
+            'genes': genes,
+            'proteins': proteins,
+            'resistance_data': resistance_data,
+            'recommendations': recommendations,
+            'blast_results': blast_results,
+        }
+
+    # Cached report generation - keyed on a canonical JSON dump of the
+    # analysis payload so re-analyzing identical data skips the OpenAI
+    # round-trip entirely.
+    @st.cache_data(show_spinner=False)
+    def cached_summary_report(payload_json):
+        """Generate (or fetch cached) the AI summary for a payload."""
+        return generate_summary_report(_loads_payload(payload_json))
+
+    @st.cache_data(show_spinner=False)
+    def cached_basic_report(payload_json):
+        """Generate (or fetch cached) the fallback summary for a payload."""
+        return generate_basic_report(_loads_payload(payload_json))
+
+    @st.cache_data(show_spinner=False)
+    def cached_suggestions(payload_json):
+        """Generate (or fetch cached) chat suggestions for a payload.
+
+        The suggestion generator is LLM-backed, so reruns of the chat panel
+        must not re-invoke it while the analysis is unchanged.
+        """
+        return generate_analysis_suggestions(_loads_payload(payload_json))
+
+    # Cached database reads - every rerun used to hit the DB for data that
+    # changes only when something is saved. A short ttl plus explicit
+    # .clear() after writes keeps the lists fresh.
+    @st.cache_data(ttl=30, show_spinner=False)
+    def cached_stored_sequences(limit):
+        """Fetch stored sequences, memoized briefly between reruns."""
+        return get_stored_sequences(limit=limit)
+
+    @st.cache_data(ttl=300, show_spinner=False)
+    def cached_sequence_data(data_id):
+        """Fetch one stored sequence; rows are immutable so a longer ttl is safe."""
+        return get_sequence_data(data_id)
+
+    @st.cache_data(ttl=30, show_spinner=False)
+    def cached_analysis_history(limit):
+        """Fetch analysis history, memoized briefly between reruns."""
+        return get_analysis_history(limit=limit)
+
+    @st.cache_data(ttl=300, show_spinner=False)
+    def cached_analysis_result(result_id):
+        """Fetch one stored result; rows are immutable so a longer ttl is safe."""
+        return get_analysis_result(result_id)
+
+    @st.cache_data(show_spinner=False)
+    def history_table(history):
+        """Build the display frame for the history page.
+
+        Date formatting (a branchy per-row pass) runs once per distinct
+        history payload instead of on every fragment rerun.
+        """
+        df = pd.DataFrame(history)
+        # Format the date - handling both datetime and string formats
+        df['created_at'] = df['created_at'].map(
+            lambda d: d.strftime('%Y-%m-%d %H:%M') if hasattr(d, 'strftime') else (str(d) if d else "")
+        )
+        df = df[['id', 'sequence_name', 'created_at', 'num_genes', 'num_resistance_markers']]
+        df.columns = ['ID', 'Sequence Name', 'Date', 'Genes', 'Resistance Markers']
+        return df
+
+    @st.cache_data(show_spinner=False)
+    def records_to_df(records):
+        """Convert analysis records to a DataFrame once per analysis.
+
+        The genes/resistance/recommendation lists only change when a new
+        analysis runs, but the tabs re-render on every interaction - caching
+        the conversion keeps the list-of-dicts -> DataFrame cost off the
+        rerun path.
+        """
+        return pd.DataFrame(records)
+
+    @st.cache_data(show_spinner=False)
+    def project_view(records, cols):
+        """Build a display-ready column projection once per analysis.
+
+        Projecting with df[[cols]] copies the selected columns on every
+        rerun; doing it inside the cache means the view is materialized
+        only when the underlying records change. convert_dtypes gives the
+        object columns concrete types so the Arrow serialization to the
+        front-end stays compact.
+        """
+        return pd.DataFrame(records).loc[:, list(cols)].convert_dtypes()
+
+    @st.cache_data(show_spinner=False)
+    def recommendation_views(records):
+        """Split recommendations into projected effective/ineffective views."""
+        df = pd.DataFrame(records)
+        # dtype=bool guards against object-dtype columns from JSON-loaded
+        # records, keeping the partition a single vectorized mask
+        mask = df['effective'].to_numpy(dtype=bool)
+        cols = ['antibiotic', 'confidence', 'rationale']
+        return df[mask].loc[:, cols], df[~mask].loc[:, cols]
+
+    @st.cache_data(show_spinner=False)
+    def blast_hits_table(all_hits):
+        """Build the BLAST hits display table as an Arrow table.
+
+        st.dataframe serializes via Arrow anyway; handing it a cached
+        pyarrow.Table skips the per-rerun pandas construction and the
+        pandas -> Arrow conversion entirely.
+        """
+        n = len(all_hits)
+        identities = np.fromiter(
+            (hit['identity'] for hit in all_hits), dtype=np.float32, count=n
+        ) * np.float32(100)
+        # Sort by identity (higher is better) - one argsort permutation
+        # applied to each column instead of sorting a list of row dicts
+        order = np.argsort(-identities, kind='stable')
+        e_values = np.fromiter(
+            (hit['e_value'] for hit in all_hits), dtype=np.float64, count=n
+        )[order]
+        lengths = np.fromiter(
+            (hit['length'] for hit in all_hits), dtype=np.int32, count=n
+        )[order]
+        scores = np.fromiter(
+            (hit['score'] for hit in all_hits), dtype=np.float32, count=n
+        )[order]
+        # Column arrays go straight into Arrow buffers - no per-row dict
+        # materialization or schema inference
+        return pa.Table.from_pydict({
+            'Title': [all_hits[i]['title'] for i in order],
+            'E-value': e_values,
+            'Identity (%)': np.round(identities[order], 2),
+            'Length': lengths,
+            'Score': scores,
+            'Accession': [all_hits[i]['accession'] for i in order],
+        }, schema=pa.schema([
+            ('Title', pa.string()),
+            ('E-value', pa.float64()),
+            ('Identity (%)', pa.float32()),
+            ('Length', pa.int32()),
+            ('Score', pa.float32()),
+            ('Accession', pa.string()),
+        ]))
+
+    @st.cache_data(show_spinner=False)
+    def class_counts_table(class_counts):
+        """Build the Class/Count frame for the BLAST class bar chart.
+
+        Takes the small {class_name: count} dict so the cache key is cheap,
+        and runs the title-case transform through vectorized Series.str ops
+        instead of a per-class Python comprehension.
+        """
+        df = pd.Series(class_counts, name='Count').rename_axis('class').reset_index()
+        df['Class'] = df['class'].str.replace('_', ' ', regex=False).str.title()
+        return df[['Class', 'Count']]
+
+    @st.cache_data(show_spinner=False)
+    def build_class_bar(class_counts):
+        """Build (or fetch cached) the resistance-class bar chart."""
+        return px.bar(
+            class_counts_table(class_counts),
+            x='Class',
+            y='Count',
+            title='Resistance Genes Detected by Class',
+            color='Count',
+            color_continuous_scale='Reds'
+        )
+
+    @st.cache_data(show_spinner=False)
+    def build_mechanism_pie(resistance_records):
+        """Build (or fetch cached) resistance mechanism pie chart.
+
+        Feeds go.Pie straight from the value_counts index/values - no
+        intermediate Mechanism/Count frame to allocate.
+        """
+        counts = pd.DataFrame(resistance_records)['mechanism'].value_counts()
+        fig = go.Figure(go.Pie(
+            labels=counts.index,
+            values=counts.to_numpy(),
+        ))
+        fig.update_layout(title='Distribution of Resistance Mechanisms')
+        return fig
+
+    # Create database tables if they don't exist - DDL needs to run exactly
+    # once per process, not once per rerun, so the side effect is memoized
+    # as a resource
+    @st.cache_resource(show_spinner=False)
+    def init_db():
+        create_tables()
+        return True
+
+    init_db()
     
     # Page configuration
     st.set_page_config(
@@ -48,205 +668,103 @@ def main():
     )
     
     # Load animations
+    @st.cache_data(ttl=86400, show_spinner=False, persist="disk")
     def load_lottie_url(url):
-        """Load a Lottie animation from a URL."""
+        """Load a Lottie animation from a URL (cached for a day).
+
+        Persisted to disk so a server restart reuses the downloaded JSON
+        instead of re-hitting the CDN.
+        """
         try:
-            r = requests.get(url)
+            r = LOTTIE_SESSION.get(url, timeout=3)
             if r.status_code != 200:
                 return None
             return r.json()
         except:
             return None
+
+    # Lottie asset URLs - each animation is fetched lazily (and cached) at
+    # the site that renders it, so pages that never show one skip the
+    # network round-trip entirely
+    LOTTIE_URLS = {
+        'molecule': 'https://assets3.lottiefiles.com/packages/lf20_UgZWvP.json',
+        'laboratory': 'https://assets5.lottiefiles.com/packages/lf20_vwgfy3ve.json',
+        'dna_loading': 'https://assets6.lottiefiles.com/packages/lf20_ft8ck4lv.json',
+        'analysis_loading': 'https://assets2.lottiefiles.com/private_files/lf30_l8csvun7.json',
+        'search_loading': 'https://assets2.lottiefiles.com/packages/lf20_zwn6fgkj.json',
+        'team': 'https://assets1.lottiefiles.com/packages/lf20_vkwkzftx.json',
+        'doctor': 'https://assets1.lottiefiles.com/packages/lf20_s7vzlpm5.json',
+        'genome': 'https://assets4.lottiefiles.com/packages/lf20_xlmz9xwm.json',
+    }
+
+    def show_phase(container, title, subtitle, anim_key, lottie_key):
+        """Render one loading-phase panel into the shared container.
+
+        The analyze flow shows several near-identical phase screens; one
+        parameterized builder replaces the copy-pasted column/markdown
+        blocks. Keys stay distinct because the phases render within a
+        single script run.
+        """
+        with container.container():
+            col1, col2, col3 = st.columns([1, 2, 1])
+            with col2:
+                st.markdown(
+                    f"<h3 style='text-align: center; color: #1976d2;'>{title}</h3>",
+                    unsafe_allow_html=True
+                )
+                animation = load_lottie_url(LOTTIE_URLS[anim_key])
+                if animation:
+                    st_lottie(animation, speed=1, height=200, key=lottie_key)
+                st.markdown(
+                    f"<p style='text-align: center; color: #666;'>{subtitle}</p>",
+                    unsafe_allow_html=True
+                )
+
+    # Warm the animation cache once per session with overlapped downloads -
+    # cold start pays ~one CDN round-trip for all eight files instead of a
+    # serial fetch at each render site
+    if not st.session_state.get('_lottie_prefetched'):
+        with ThreadPoolExecutor(max_workers=len(LOTTIE_URLS)) as lottie_pool:
+            list(lottie_pool.map(load_lottie_url, LOTTIE_URLS.values()))
+        st.session_state._lottie_prefetched = True
+
+    # Initialize session state variables in a single pass. chat_history
+    # starts as None and is built lazily on first use so plain reruns don't
+    # pay for assembling the system prompt.
+    SESSION_DEFAULTS = {
+        'genes': [],
+        'proteins': [],
+        'resistance_data': [],
+        'recommendations': [],
+        'blast_results': {},
+        'summary_report': "",
+        'has_analysis': False,
+        'result_saved': False,
+        'current_sequence_name': "",
+        'current_sequence_type': "",
+        'chat_history': None,
+        'current_sequence': "",
+        'use_blast_search': True,
+        'blast_hit_cap': 500,
+        'analysis_version': 0,
+        'nav_page': "home",
+        'show_landing_page': True,
+    }
+    # One sentinel test per rerun instead of a per-key setdefault chain
+    if '_initialized' not in st.session_state:
+        st.session_state.update(SESSION_DEFAULTS)
+        st.session_state._initialized = True
     
-    # Load animations
-    molecule_animation = load_lottie_url('https://assets3.lottiefiles.com/packages/lf20_UgZWvP.json')
-    laboratory_animation = load_lottie_url('https://assets5.lottiefiles.com/packages/lf20_vwgfy3ve.json')
-    dna_loading_animation = load_lottie_url('https://assets6.lottiefiles.com/packages/lf20_ft8ck4lv.json')
-    analysis_loading_animation = load_lottie_url('https://assets2.lottiefiles.com/private_files/lf30_l8csvun7.json')
-    search_loading_animation = load_lottie_url('https://assets2.lottiefiles.com/packages/lf20_zwn6fgkj.json')
-    team_animation = load_lottie_url('https://assets1.lottiefiles.com/packages/lf20_vkwkzftx.json')
-    doctor_animation = load_lottie_url('https://assets1.lottiefiles.com/packages/lf20_s7vzlpm5.json')
-    genome_animation = load_lottie_url('https://assets4.lottiefiles.com/packages/lf20_xlmz9xwm.json')
-    
-    # Initialize session state variables if they don't exist
-    if 'genes' not in st.session_state:
-        st.session_state.genes = []
-    if 'proteins' not in st.session_state:
-        st.session_state.proteins = []
-    if 'resistance_data' not in st.session_state:
-        st.session_state.resistance_data = []
-    if 'recommendations' not in st.session_state:
-        st.session_state.recommendations = []
-    if 'blast_results' not in st.session_state:
-        st.session_state.blast_results = {}
-    if 'summary_report' not in st.session_state:
-        st.session_state.summary_report = ""
-    if 'has_analysis' not in st.session_state:
-        st.session_state.has_analysis = False
-    if 'result_saved' not in st.session_state:
-        st.session_state.result_saved = False
-    if 'current_sequence_name' not in st.session_state:
-        st.session_state.current_sequence_name = ""
-    if 'current_sequence_type' not in st.session_state:
-        st.session_state.current_sequence_type = ""
-    if 'chat_history' not in st.session_state:
-        st.session_state.chat_history = initialize_chat_history()
-    if 'current_sequence' not in st.session_state:
-        st.session_state.current_sequence = ""
-    if 'use_blast_search' not in st.session_state:
-        st.session_state.use_blast_search = True
-    if 'nav_page' not in st.session_state:
-        st.session_state.nav_page = "home"
-    if 'show_landing_page' not in st.session_state:
-        st.session_state.show_landing_page = True
-    
-    # Custom CSS with medical theme
-    st.markdown("""
-    <style>
-        /* Main Background styling */
-        section[data-testid="stSidebar"] {
-            background-color: #f8f9fa;
-            border-right: 1px solid #e9ecef;
-        }
-        
-        [data-testid="stAppViewBlockContainer"] {
-            background-color: #ffffff;
-            background-image: 
-                linear-gradient(135deg, rgba(210, 235, 255, 0.1) 25%, transparent 25%),
-                linear-gradient(225deg, rgba(210, 235, 255, 0.1) 25%, transparent 25%),
-                linear-gradient(45deg, rgba(210, 235, 255, 0.1) 25%, transparent 25%),
-                linear-gradient(315deg, rgba(210, 235, 255, 0.1) 25%, transparent 25%);
-            background-position: 40px 0, 40px 0, 0 0, 0 0;
-            background-size: 80px 80px;
-            background-repeat: repeat;
-        }
-        
-        /* Headers */
-        .main-header {
-            font-size: 2.5rem;
-            color: #1976d2;
-            margin-bottom: 1rem;
-            font-weight: 600;
-            text-shadow: 1px 1px 2px rgba(0, 0, 0, 0.1);
-        }
-        .sub-header {
-            font-size: 1.5rem;
-            color: #0d47a1;
-            margin-bottom: 1rem;
-            font-weight: 400;
-        }
-        
-        /* Tabs styling */
-        .stTabs [data-baseweb="tab-list"] {
-            gap: 8px;
-            border-bottom: 2px solid #e9ecef;
-            padding-bottom: 4px;
-        }
-        .stTabs [data-baseweb="tab"] {
-            height: 50px;
-            white-space: pre-wrap;
-            background-color: #f8f9fa;
-            border-radius: 8px 8px 0px 0px;
-            gap: 1px;
-            padding: 10px 16px;
-            font-weight: 500;
-            border: 1px solid #e9ecef;
-            border-bottom: none;
-            transition: all 0.3s ease;
-        }
-        .stTabs [aria-selected="true"] {
-            background-color: #1976d2;
-            color: white;
-            border-color: #1976d2;
-            transform: translateY(-4px);
-        }
-        
-        /* Cards for content */
-        .stCard {
-            background-color: white;
-            border-radius: 8px;
-            padding: 20px;
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.05);
-            margin-bottom: 1rem;
-            border: 1px solid #e9ecef;
-        }
-        
-        /* Button styling */
-        .stButton button {
-            border-radius: 6px;
-            font-weight: 500;
-            transition: all 0.2s ease;
-        }
-        .stButton button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
-        }
-        
-        /* Metrics styling */
-        [data-testid="stMetric"] {
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            padding: 10px;
-            border: 1px solid #e9ecef;
-        }
-        [data-testid="stMetricLabel"] {
-            font-size: 1rem;
-            font-weight: 500;
-        }
-        
-        /* Dataframe styling */
-        .dataframe {
-            border-radius: 8px;
-            overflow: hidden;
-            border: 1px solid #e9ecef;
-        }
-        .dataframe th {
-            background-color: #1976d2;
-            color: white;
-            font-weight: 500;
-        }
-        
-        /* Info/warning boxes */
-        .stAlert {
-            border-radius: 8px;
-        }
-        
-        /* Navigation buttons */
-        .nav-button {
-            display: block;
-            width: 100%;
-            padding: 12px 15px;
-            margin-bottom: 8px;
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            text-decoration: none;
-            color: #0d47a1;
-            font-weight: 500;
-            font-size: 1.05rem;
-            border-left: 3px solid transparent;
-            transition: all 0.2s ease;
-        }
-        .nav-button:hover {
-            background-color: #e3f2fd;
-            border-left-color: #2196f3;
-            cursor: pointer;
-        }
-        .nav-button.active {
-            background-color: #e3f2fd;
-            border-left-color: #1976d2;
-            color: #1976d2;
-            font-weight: 600;
-        }
-        .nav-icon {
-            margin-right: 10px;
-            font-size: 1.2em;
-            vertical-align: middle;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    # Inject the custom CSS on every run - Streamlit drops elements that
+    # aren't re-emitted, so gating this behind a session flag would strip
+    # the theme on the first full rerun. The stylesheet itself is read once
+    # per process by load_app_css.
+    st.html(f"<style>{load_app_css()}</style>")
     
-    # Sidebar with medical theme
-    with st.sidebar:
+    # Sidebar with medical theme - wrapped in a fragment so interactions
+    # with the input widgets rerun only this panel, not the result tabs
+    @st.fragment
+    def render_sidebar():
         st.markdown('<div class="main-header">GeneHack AMR</div>', unsafe_allow_html=True)
         st.markdown('<div class="sub-header">Antimicrobial Resistance Analysis</div>', unsafe_allow_html=True)
         
@@ -285,6 +803,12 @@ def main():
                 
                 if use_blast:
                     st.info("BLAST search will provide more accurate resistance gene identification and antibiotic effectiveness predictions.")
+                    st.session_state.blast_hit_cap = st.number_input(
+                        "Maximum BLAST hits to process",
+                        min_value=50, max_value=10000, step=50,
+                        value=st.session_state.blast_hit_cap,
+                        help="Only the top hits by identity are kept. Raise this to analyze more hits at the cost of slower post-processing."
+                    )
             
             # Initialize sequence variable
             sequence = ""
@@ -294,15 +818,18 @@ def main():
                                                  type=["fasta", "fa", "fna", "ffn", "txt"])
                 
                 if uploaded_file is not None:
-                    file_content = uploaded_file.getvalue().decode("utf-8")
-                    sequences = parse_fasta(file_content)
+                    sequences = parse_fasta_cached(uploaded_file.getvalue())
                     
                     if sequences:
-                        # If multiple sequences found, let user select one
+                        # If multiple sequences found, let user select one.
+                        # Selecting over indices gives the position directly
+                        # instead of an O(N) .index() scan over labels.
                         if len(sequences) > 1:
-                            sequence_options = [f"{name} ({len(seq)} bp)" for name, seq in sequences]
-                            selected_seq = st.selectbox("Select sequence to analyze:", sequence_options)
-                            selected_idx = sequence_options.index(selected_seq)
+                            selected_idx = st.selectbox(
+                                "Select sequence to analyze:",
+                                options=range(len(sequences)),
+                                format_func=lambda i: f"{sequences[i][0]} ({len(sequences[i][1])} bp)"
+                            )
                             seq_name, sequence = sequences[selected_idx]
                         else:
                             seq_name, sequence = sequences[0]
@@ -317,14 +844,22 @@ def main():
                         sequence = ""
             
             elif input_method == "Enter Raw Sequence":
-                sequence = st.text_area("Enter DNA sequence", 
-                                     height=150, 
-                                     help="Paste a raw DNA sequence (A, T, G, C).")
-                
+                # The form batches typing - the app only reruns (and
+                # validates) when the sequence is submitted, not per
+                # keystroke. Analyze lives inside the form too: a submit
+                # flushes the text area, so analysis always runs on what the
+                # box currently shows, never a stale earlier submission
+                with st.form("raw_seq_form"):
+                    sequence = st.text_area("Enter DNA sequence",
+                                         height=150,
+                                         help="Paste a raw DNA sequence (A, T, G, C).")
+                    st.form_submit_button("Validate Sequence")
+                    raw_analyze_submit = st.form_submit_button("Analyze Sequence", type="primary")
+
                 st.session_state.current_sequence_name = "Raw Sequence"
                 st.session_state.current_sequence_type = "raw"
-                
-                # Validate sequence
+
+                # Validate sequence (runs on the submitted value only)
                 if sequence:
                     if validate_sequence(sequence):
                         st.info(f"Valid DNA sequence ({len(sequence)} bp)")
@@ -333,7 +868,7 @@ def main():
                         sequence = ""
             
             elif input_method == "Load Saved Sequence":
-                saved_sequences = get_stored_sequences(limit=50)
+                saved_sequences = cached_stored_sequences(limit=50)
                 
                 if saved_sequences:
                     sequence_options = [f"{seq['name']} ({seq['data_type']}, ID: {seq['id']})" for seq in saved_sequences]
@@ -342,8 +877,8 @@ def main():
                     # Extract ID from selected option
                     selected_id = int(selected_option.split("ID: ")[1].split(")")[0])
                     
-                    # Get the selected sequence data
-                    selected_seq = get_sequence_data(selected_id)
+                    # Get the selected sequence data (memoized by id)
+                    selected_seq = cached_sequence_data(selected_id)
                     
                     if selected_seq:
                         sequence = selected_seq["sequence"]
@@ -358,8 +893,13 @@ def main():
                     st.info("No saved sequences found.")
                     sequence = ""
             
-            # Analysis button
-            analyze_button = st.button("Analyze Sequence", type="primary", disabled=not sequence)
+            # Analysis button - the raw-sequence branch analyzes through its
+            # form submit instead, so the outside button can't run on a value
+            # the user has since edited
+            if input_method == "Enter Raw Sequence":
+                analyze_button = raw_analyze_submit
+            else:
+                analyze_button = st.button("Analyze Sequence", type="primary", disabled=not sequence)
             
             if analyze_button and sequence:
                 # Reset session state for new analysis
@@ -370,6 +910,9 @@ def main():
                 st.session_state.summary_report = ""
                 st.session_state.has_analysis = False
                 st.session_state.result_saved = False
+                # Drop the save fingerprint - the dedupe guard only covers
+                # repeat saves of this analysis, never a fresh one
+                st.session_state.pop('_last_saved_hash', None)
                 
                 # Save current sequence for later use
                 st.session_state.current_sequence = sequence
@@ -378,13 +921,11 @@ def main():
                 loading_container = st.empty()
                 
                 # Show animated loading indicators
-                with loading_container.container():
-                    col1, col2, col3 = st.columns([1, 2, 1])
-                    with col2:
-                        st.markdown("<h3 style='text-align: center; color: #1976d2;'>Analyzing Bacterial Genome</h3>", unsafe_allow_html=True)
-                        if dna_loading_animation:
-                            st_lottie(dna_loading_animation, speed=1, height=200, key="dna_loading")
-                        st.markdown("<p style='text-align: center; color: #666;'>Processing sequence data for resistance markers...</p>", unsafe_allow_html=True)
+                show_phase(
+                    loading_container, "Analyzing Bacterial Genome",
+                    "Processing sequence data for resistance markers...",
+                    'dna_loading', "dna_loading"
+                )
                 
                 # Show progress
                 with st.spinner("Analyzing bacterial genome for resistance genes..."):
@@ -392,186 +933,89 @@ def main():
                         # Approach 1: Use BLAST search for more accurate results
                         with st.status("Running BLAST search against AMR databases...", expanded=True) as status:
                             # Update animation to show search-specific animation
-                            with loading_container.container():
-                                col1, col2, col3 = st.columns([1, 2, 1])
-                                with col2:
-                                    st.markdown("<h3 style='text-align: center; color: #1976d2;'>Running BLAST Search</h3>", unsafe_allow_html=True)
-                                    if search_loading_animation:
-                                        st_lottie(search_loading_animation, speed=1, height=200, key="search_loading")
-                                    st.markdown("<p style='text-align: center; color: #666;'>Searching for resistance genes in databases...</p>", unsafe_allow_html=True)
+                            show_phase(
+                                loading_container, "Running BLAST Search",
+                                "Searching for resistance genes in databases...",
+                                'search_loading', "search_loading"
+                            )
                             
                             st.write("Searching for resistance genes...")
-                            
-                            # Run BLAST search
-                            blast_results = search_amr_database(
-                                sequence=sequence,
-                                sequence_name=st.session_state.current_sequence_name
+
+                            # Run the cached pipeline (BLAST + translation)
+                            # on a worker thread; the script thread keeps
+                            # driving the status label while it runs, so the
+                            # UI doesn't freeze for the BLAST round-trip
+                            pipeline_future = BLAST_POOL.submit(
+                                run_pipeline,
+                                sequence,
+                                st.session_state.current_sequence_name,
+                                True,
+                                max_hits=st.session_state.blast_hit_cap
                             )
-                            
-                            # Store BLAST results
-                            st.session_state.blast_results = blast_results
-                            
-                            # Convert BLAST hits to gene predictions
-                            st.session_state.genes = []
-                            gene_id = 1
-                            
-                            for hit in blast_results.get('all_hits', []):
-                                gene_name = hit['title'].split()[0]  # First word of hit title
-                                st.session_state.genes.append({
-                                    'id': f"BLAST_{gene_id}",
-                                    'name': gene_name,
-                                    'sequence_name': st.session_state.current_sequence_name,
-                                    'start_pos': hit['query_start'],
-                                    'end_pos': hit['query_end'],
-                                    'confidence': hit['identity'],
-                                    'description': hit['title'],
-                                    'e_value': hit['e_value']
-                                })
-                                gene_id += 1
-                            
-                            # Extract resistance data from BLAST results
-                            st.session_state.resistance_data = []
-                            
-                            for class_name, hits in blast_results.get('hits_by_class', {}).items():
-                                for hit in hits:
-                                    antibiotic_class = class_name.replace('_', ' ').title()
-                                    st.session_state.resistance_data.append({
-                                        'sequence_name': st.session_state.current_sequence_name,
-                                        'gene_name': hit['title'].split()[0],
-                                        'gene_id': hit['accession'],
-                                        'antibiotic': antibiotic_class,
-                                        'resistance_level': 'High' if hit['identity'] > 0.9 else 'Moderate' if hit['identity'] > 0.8 else 'Low',
-                                        'mechanism': 'Unknown' if 'mechanism' not in hit else hit['mechanism'],
-                                        'confidence': hit['identity']
-                                    })
-                            
-                            # Set recommendations from BLAST results
-                            st.session_state.recommendations = []
-                            
-                            for antibiotic, data in blast_results.get('antibiotic_effectiveness', {}).items():
-                                st.session_state.recommendations.append({
-                                    'antibiotic': antibiotic,
-                                    'effective': data['effective'],
-                                    'confidence': data['confidence'],
-                                    'rationale': data['rationale']
-                                })
-                            
-                            # Generate protein sequences from genes
-                            st.session_state.proteins = []
-                            for gene in st.session_state.genes:
-                                # Extract gene sequence if we have position info
-                                if 'start_pos' in gene and 'end_pos' in gene:
-                                    start = max(0, gene['start_pos'] - 1)  # 1-based to 0-based
-                                    end = min(len(sequence), gene['end_pos'])
-                                    gene_seq = sequence[start:end]
-                                    
-                                    # Translate to protein
-                                    protein_seq = translate_to_protein(gene_seq)
-                                    
-                                    # Store protein data
-                                    st.session_state.proteins.append({
-                                        'sequence_name': gene['sequence_name'],
-                                        'gene_id': gene['id'],
-                                        'gene_name': gene['name'],
-                                        'protein_sequence': protein_seq,
-                                        'length': len(protein_seq),
-                                        'domains': gene.get('domains', []),
-                                        'functions': gene.get('functions', [])
-                                    })
-                            
+                            started = time.time()
+                            while not pipeline_future.done():
+                                status.update(
+                                    label=f"Running BLAST search... {int(time.time() - started)}s"
+                                )
+                                time.sleep(0.25)
+                            results = pipeline_future.result()
+
                             # Update animation to show analysis animation
-                            with loading_container.container():
-                                col1, col2, col3 = st.columns([1, 2, 1])
-                                with col2:
-                                    st.markdown("<h3 style='text-align: center; color: #1976d2;'>Analyzing Results</h3>", unsafe_allow_html=True)
-                                    if analysis_loading_animation:
-                                        st_lottie(analysis_loading_animation, speed=1, height=200, key="analysis_loading")
-                                    st.markdown("<p style='text-align: center; color: #666;'>Analyzing resistance patterns and generating recommendations...</p>", unsafe_allow_html=True)
+                            show_phase(
+                                loading_container, "Analyzing Results",
+                                "Analyzing resistance patterns and generating recommendations...",
+                                'analysis_loading', "analysis_loading"
+                            )
                             
                             status.update(label="BLAST search complete", state="complete", expanded=False)
                     else:
                         # Approach 2: Use built-in prediction methods (fallback)
                         # Show different animation for this path
-                        with loading_container.container():
-                            col1, col2, col3 = st.columns([1, 2, 1])
-                            with col2:
-                                st.markdown("<h3 style='text-align: center; color: #1976d2;'>Gene Prediction</h3>", unsafe_allow_html=True)
-                                if analysis_loading_animation:
-                                    st_lottie(analysis_loading_animation, speed=1, height=200, key="gene_loading")
-                                st.markdown("<p style='text-align: center; color: #666;'>Predicting resistance genes from sequence patterns...</p>", unsafe_allow_html=True)
-                        
-                        # 1. Predict AMR genes
-                        st.session_state.genes = predict_amr_genes(
-                            sequence=sequence,
-                            sequence_name=st.session_state.current_sequence_name
+                        show_phase(
+                            loading_container, "Gene Prediction",
+                            "Predicting resistance genes from sequence patterns...",
+                            'analysis_loading', "gene_loading"
                         )
                         
-                        # 2. Generate protein sequences
-                        st.session_state.proteins = []
-                        for gene in st.session_state.genes:
-                            # Extract gene sequence
-                            gene_seq = sequence[gene['start_pos']:gene['end_pos']]
-                            
-                            # Translate to protein
-                            protein_seq = translate_to_protein(gene_seq)
-                            
-                            # Store protein data
-                            st.session_state.proteins.append({
-                                'sequence_name': gene['sequence_name'],
-                                'gene_id': gene['id'],
-                                'gene_name': gene['name'],
-                                'protein_sequence': protein_seq,
-                                'length': len(protein_seq),
-                                'domains': gene.get('domains', []),
-                                'functions': gene.get('functions', [])
-                            })
-                        
-                        # 3. Analyze resistance
-                        st.session_state.resistance_data = []
-                        for protein in st.session_state.proteins:
-                            # Analyze protein for resistance markers
-                            resistance_results = analyze_protein_resistance(
-                                protein['protein_sequence'], 
-                                protein['gene_name']
-                            )
-                            
-                            # Add sequence name to resistance data
-                            for r in resistance_results:
-                                r['sequence_name'] = protein['sequence_name']
-                                r['gene_id'] = protein['gene_id']
-                            
-                            # Add to session state
-                            st.session_state.resistance_data.extend(resistance_results)
-                        
-                        # 4. Generate recommendations
-                        st.session_state.recommendations = get_antibiotic_recommendations(
-                            st.session_state.resistance_data
+                        # Run the cached pipeline (prediction + translation +
+                        # resistance analysis)
+                        results = run_pipeline(
+                            sequence,
+                            st.session_state.current_sequence_name,
+                            False
                         )
-                    
+
+                    # Unpack the pipeline results into session state
+                    st.session_state.genes = results['genes']
+                    st.session_state.proteins = results['proteins']
+                    st.session_state.resistance_data = results['resistance_data']
+                    st.session_state.recommendations = results['recommendations']
+                    st.session_state.blast_results = results['blast_results']
+                    # Bumped once per completed analysis; anything keyed on
+                    # it (figures, suggestion widgets) is reused untouched
+                    # by chat or navigation reruns in between
+                    st.session_state.analysis_version += 1
+
                     # 5. Generate summary report
                     # Show final report generation animation
-                    with loading_container.container():
-                        col1, col2, col3 = st.columns([1, 2, 1])
-                        with col2:
-                            st.markdown("<h3 style='text-align: center; color: #1976d2;'>Generating Report</h3>", unsafe_allow_html=True)
-                            if dna_loading_animation:
-                                st_lottie(dna_loading_animation, speed=1, height=200, key="summary_loading")
-                            st.markdown("<p style='text-align: center; color: #666;'>Creating comprehensive analysis report...</p>", unsafe_allow_html=True)
+                    show_phase(
+                        loading_container, "Generating Report",
+                        "Creating comprehensive analysis report...",
+                        'dna_loading', "summary_loading"
+                    )
                     
+                    summary_payload = _dumps_payload({
+                        'genes': st.session_state.genes,
+                        'resistance_data': st.session_state.resistance_data,
+                        'recommendations': st.session_state.recommendations
+                    })
+
                     try:
-                        st.session_state.summary_report = generate_summary_report({
-                            'genes': st.session_state.genes,
-                            'resistance_data': st.session_state.resistance_data,
-                            'recommendations': st.session_state.recommendations
-                        })
+                        st.session_state.summary_report = cached_summary_report(summary_payload)
                     except Exception as e:
                         # Fallback to basic report if API call fails
                         st.warning(f"Could not generate AI summary: {str(e)}. Using basic summary instead.")
-                        st.session_state.summary_report = generate_basic_report({
-                            'genes': st.session_state.genes,
-                            'resistance_data': st.session_state.resistance_data,
-                            'recommendations': st.session_state.recommendations
-                        })
+                        st.session_state.summary_report = cached_basic_report(summary_payload)
                         
                     # Clear the loading animation container when done
                     loading_container.empty()
@@ -585,10 +1029,15 @@ def main():
                                 sequence=sequence,
                                 description=f"Sequence with {len(st.session_state.genes)} AMR genes"
                             )
+                            # Drop the cached list so the new entry shows up
+                            cached_stored_sequences.clear()
                         except Exception as e:
                             st.sidebar.warning(f"Failed to save sequence: {str(e)}")
                     
-                    # Update chat history with analysis context
+                    # Update chat history with analysis context (built
+                    # lazily here on first use)
+                    if st.session_state.chat_history is None:
+                        st.session_state.chat_history = initialize_chat_history()
                     st.session_state.chat_history = add_analysis_context(
                         st.session_state.chat_history,
                         {
@@ -605,127 +1054,54 @@ def main():
                     st.rerun()
     
     # Check if we should show the landing page or the main app
+    with st.sidebar:
+        render_sidebar()
+
     if st.session_state.show_landing_page:
-        # Hide sidebar for landing page
-        st.markdown("""
-        <style>
-        [data-testid="stSidebar"] {
-            display: none;
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
-        # Landing page content
-        st.markdown("""
-        <div style="text-align: center; margin-top: 10px;">
-            <h1 style="color: #0d47a1; font-size: 3.5rem; margin-bottom: 10px; font-weight: 700;">GeneHack AMR</h1>
-            <p style="color: #424242; font-size: 1.5rem; margin-bottom: 30px;">Revolutionizing Antimicrobial Resistance Analysis</p>
-        </div>
-        """, unsafe_allow_html=True)
+        # Hide sidebar and render the hero header in one markdown call -
+        # each st.markdown is a separate element in the frontend, so adjacent
+        # static blocks are batched to cut per-element overhead
+        st.markdown(_LANDING_HERO_HTML, unsafe_allow_html=True)
         
         # Animated banner
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
+            genome_animation = load_lottie_url(LOTTIE_URLS['genome'])
             if genome_animation:
                 st_lottie(genome_animation, speed=1, height=250, key="genome")
         
-        # Project introduction
-        st.markdown("""
-        <div style="background-color: #f0f7ff; padding: 25px; border-radius: 10px; margin: 20px 0; box-shadow: 0 4px 12px rgba(0,0,0,0.08); border-left: 5px solid #1976d2;">
-            <h2 style="color: #0d47a1; margin-top: 0;">Docathon Collaboration Project</h2>
-            <p style="color: #424242; font-size: 1.1rem; line-height: 1.6;">
-                GeneHack AMR is a groundbreaking tool developed during the Docathon - an innovative hackathon bringing together 
-                healthcare professionals and software engineers to solve critical medical challenges. This tool emerged from 
-                the collaboration between doctors with expertise in infectious diseases and engineers skilled in genomic analysis and AI.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        # Features section
-        st.markdown("<h2 style='color: #0d47a1; text-align: center; margin: 40px 0 30px;'>Key Features</h2>", unsafe_allow_html=True)
-        
-        feature_col1, feature_col2, feature_col3 = st.columns(3)
-        
-        with feature_col1:
-            st.markdown("""
-            <div style="background-color: white; padding: 20px; border-radius: 10px; height: 100%; box-shadow: 0 4px 6px rgba(0,0,0,0.05); border: 1px solid #e0e0e0;">
-                <h3 style="color: #1976d2; font-size: 1.3rem;">🧬 Genomic Analysis</h3>
-                <p style="color: #616161;">Identify antimicrobial resistance genes in bacterial genomes with precision using advanced BLAST technology.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with feature_col2:
-            st.markdown("""
-            <div style="background-color: white; padding: 20px; border-radius: 10px; height: 100%; box-shadow: 0 4px 6px rgba(0,0,0,0.05); border: 1px solid #e0e0e0;">
-                <h3 style="color: #1976d2; font-size: 1.3rem;">💊 Antibiotic Recommendations</h3>
-                <p style="color: #616161;">Receive data-driven guidance on effective antibiotics based on the resistance profile of analyzed bacteria.</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-        with feature_col3:
-            st.markdown("""
-            <div style="background-color: white; padding: 20px; border-radius: 10px; height: 100%; box-shadow: 0 4px 6px rgba(0,0,0,0.05); border: 1px solid #e0e0e0;">
-                <h3 style="color: #1976d2; font-size: 1.3rem;">🔬 Interactive Visualizations</h3>
-                <p style="color: #616161;">Explore resistance markers, protein structures, and antibiotic effectiveness through intuitive visual interfaces.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Team section
-        st.markdown("<h2 style='color: #0d47a1; text-align: center; margin: 40px 0 30px;'>Interdisciplinary Team</h2>", unsafe_allow_html=True)
+        # Project introduction, feature cards and team heading: all static
+        # HTML, so one markdown call renders the lot. The feature cards use a
+        # flex row instead of st.columns - three fewer containers to mount
+        st.markdown(_LANDING_INTRO_HTML, unsafe_allow_html=True)
         
         team_col1, team_col2 = st.columns([1, 1])
         
         with team_col1:
+            doctor_animation = load_lottie_url(LOTTIE_URLS['doctor'])
             if doctor_animation:
                 st_lottie(doctor_animation, speed=1, height=200, key="doctor")
-            st.markdown("""
-            <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; text-align: center;">
-                <h3 style="color: #1565c0; margin-top: 0;">Medical Professionals</h3>
-                <p style="color: #424242;">Infectious disease specialists contributing clinical expertise on antimicrobial resistance mechanisms and treatment protocols.</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_TEAM_MEDICAL_HTML, unsafe_allow_html=True)
         
         with team_col2:
+            team_animation = load_lottie_url(LOTTIE_URLS['team'])
             if team_animation:
                 st_lottie(team_animation, speed=1, height=200, key="team")
-            st.markdown("""
-            <div style="background-color: #e3f2fd; padding: 15px; border-radius: 8px; text-align: center;">
-                <h3 style="color: #1565c0; margin-top: 0;">Software Engineers</h3>
-                <p style="color: #424242;">Bioinformatics and AI specialists building the computational infrastructure for genetic analysis and data visualization.</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Impact section
-        st.markdown("""
-        <div style="background-color: #e8f5e9; padding: 25px; border-radius: 10px; margin: 40px 0 30px; box-shadow: 0 4px 12px rgba(0,0,0,0.08); border-left: 5px solid #43a047;">
-            <h2 style="color: #2e7d32; margin-top: 0;">Healthcare Impact</h2>
-            <p style="color: #424242; font-size: 1.1rem; line-height: 1.6;">
-                Antimicrobial resistance is one of the top 10 global public health threats facing humanity according to the WHO. 
-                GeneHack AMR empowers healthcare providers with rapid bacterial genome analysis to choose effective antibiotics, 
-                leading to better patient outcomes, reduced treatment failures, and slower development of resistance.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+            st.markdown(_TEAM_ENGINEERS_HTML, unsafe_allow_html=True)
         
+        # Impact section (the CTA button below needs its own widget, so it
+        # stays outside the batched block)
+        st.markdown(_IMPACT_HTML, unsafe_allow_html=True)
+
         # Call to action button
-        st.markdown("<div style='text-align: center; margin: 50px 0;'>", unsafe_allow_html=True)
-        
-        if st.button("🚀 Try GeneHack AMR Now", key="try_app_button", type="primary", 
+        if st.button("🚀 Try GeneHack AMR Now", key="try_app_button", type="primary",
                     use_container_width=True, help="Launch the application"):
             # Switch to main app
             st.session_state.show_landing_page = False
             st.rerun()
-        
-        st.markdown("</div>", unsafe_allow_html=True)
-        
+
         # Footer
-        st.markdown("""
-        <div style="text-align: center; margin-top: 60px; padding-top: 20px; border-top: 1px solid #e0e0e0;">
-            <p style="color: #9e9e9e; font-size: 0.9rem;">
-                © 2025 GeneHack AMR | Developed during Docathon | Streamlit Powered
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_LANDING_FOOTER_HTML, unsafe_allow_html=True)
     
     else:
         # Regular app content with sidebar visible
@@ -739,115 +1115,127 @@ def main():
     
     # Handle navigation between Home and History pages
     if st.session_state.nav_page == "history":
-        # History page - show past analyses
-        st.subheader("Analysis History")
-        st.markdown("View and load previous bacterial genome analyses")
+        # History page - show past analyses, isolated in a fragment so the
+        # selectbox below doesn't rerun the rest of the app
+        @st.fragment
+        def render_history_page():
+            st.subheader("Analysis History")
+            st.markdown("View and load previous bacterial genome analyses")
         
-        # Display history in a styled container
-        history_container = st.container()
-        with history_container:
-            history = get_analysis_history(limit=20)
-            if history:
-                for i, item in enumerate(history):
-                    with st.container():
-                        # Create a styled card for each history item
-                        # Format the date - handling both datetime and string formats
-                        date_str = ""
-                        if item['created_at']:
-                            if hasattr(item['created_at'], 'strftime'):
-                                # If it's a datetime object
-                                date_str = item['created_at'].strftime('%Y-%m-%d %H:%M')
-                            else:
-                                # If it's already a string
-                                date_str = str(item['created_at'])
-                        
-                        st.markdown(f"""
-                        <div style="background-color: white; border-radius: 8px; padding: 15px; margin-bottom: 15px; box-shadow: 0 2px 5px rgba(0,0,0,0.05); border: 1px solid #e0e0e0;">
-                            <h3 style="color: #0d47a1; margin-top: 0; font-size: 1.2rem;">{item['sequence_name']}</h3>
-                            <p style="color: #666; margin-bottom: 5px; font-size: 0.9rem;">
-                                <span style="color: #1976d2;">ID:</span> {item['id']} | 
-                                <span style="color: #1976d2;">Date:</span> {date_str}
-                            </p>
-                            <p style="color: #666; font-size: 0.9rem;">
-                                <span style="background-color: #e3f2fd; padding: 3px 8px; border-radius: 4px; margin-right: 10px;">
-                                    <span style="color: #1976d2;">Genes:</span> {item['num_genes']}
-                                </span>
-                                <span style="background-color: #e3f2fd; padding: 3px 8px; border-radius: 4px;">
-                                    <span style="color: #1976d2;">Resistance Markers:</span> {item['num_resistance_markers']}
-                                </span>
-                            </p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        if st.button("Load Analysis", key=f"load_{item['id']}", help="Load this analysis result"):
-                            # Load analysis from history
-                            result = get_analysis_result(item['id'])
-                            if result:
-                                # Update session state
-                                st.session_state.genes = result['genes']
-                                st.session_state.proteins = result['proteins']
-                                st.session_state.resistance_data = result['resistance_data']
-                                st.session_state.recommendations = result['recommendations']
-                                st.session_state.summary_report = result['summary_report']
-                                st.session_state.has_analysis = True
-                                st.session_state.result_saved = True
-                                st.session_state.current_sequence_name = result['sequence_name']
-                                st.session_state.current_sequence_type = result['sequence_type']
-                                
-                                # Switch to home page to display results
-                                st.session_state.nav_page = "home"
-                                
-                                # Rerun to update UI
-                                st.rerun()
-                            else:
-                                st.error("Failed to load result.")
-            else:
-                st.info("No analysis history found. Run analyses from the Home page to see them here.")
+            # Display history in a styled container
+            history_container = st.container()
+            with history_container:
+                history = cached_analysis_history(limit=20)
+                if history:
+                    # One table plus a single selectbox/button pair instead of a
+                    # markdown card and button per entry - per-widget overhead
+                    # dominates with 20+ rows. The formatted frame is cached
+                    # per history payload.
+                    st.dataframe(history_table(history), use_container_width=True, hide_index=True)
+
+                    # A form batches the selectbox with the button, so picking
+                    # an entry doesn't rerun anything until Load is pressed
+                    labels = {item['id']: item['sequence_name'] for item in history}
+                    with st.form("history_form"):
+                        selected_id = st.selectbox(
+                            "Select analysis to load:",
+                            options=list(labels),
+                            format_func=lambda i: f"{labels[i]} (ID: {i})"
+                        )
+                        load_clicked = st.form_submit_button(
+                            "Load Analysis", help="Load the selected analysis result")
+
+                    if load_clicked:
+                        # Load analysis from history
+                        result = cached_analysis_result(selected_id)
+                        if result:
+                            # Update session state
+                            st.session_state.genes = result['genes']
+                            st.session_state.proteins = result['proteins']
+                            st.session_state.resistance_data = result['resistance_data']
+                            st.session_state.recommendations = result['recommendations']
+                            st.session_state.summary_report = result['summary_report']
+                            st.session_state.has_analysis = True
+                            st.session_state.result_saved = True
+                            st.session_state.current_sequence_name = result['sequence_name']
+                            st.session_state.current_sequence_type = result['sequence_type']
+
+                            # Switch to home page to display results
+                            st.session_state.nav_page = "home"
+
+                            # Rerun to update UI
+                            st.rerun()
+                        else:
+                            st.error("Failed to load result.")
+                else:
+                    st.info("No analysis history found. Run analyses from the Home page to see them here.")
                 
-                # Add a button to go to home page
-                if st.button("Go to Home Page", type="primary"):
-                    st.session_state.nav_page = "home"
-                    st.rerun()
+                    # Add a button to go to home page
+                    if st.button("Go to Home Page", type="primary"):
+                        st.session_state.nav_page = "home"
+                        st.rerun()
+
+        render_history_page()
     
     elif st.session_state.nav_page == "home":
         # Home page - show analysis results if available
         
         # Only show analysis results if we have data
         if st.session_state.has_analysis:
-            # Create columns for save UI
-            save_col1, save_col2 = st.columns([3, 1])
-            
-            # Initialize sequence_name variable
-            sequence_name = st.session_state.current_sequence_name if st.session_state.current_sequence_name else "My Sequence"
-            
-            with save_col1:
-                if not st.session_state.result_saved:
-                    sequence_name = st.text_input("Sequence Name for Saving", 
-                                                 value=sequence_name)
-                else:
-                    st.info(f"Saved as: {st.session_state.current_sequence_name} ✓")
-            
-            # Initialize save_button variable
-            save_button = False
-            
-            with save_col2:
+            def analysis_content_hash():
+                """Cheap fingerprint of the current analysis (gene/protein ids)."""
+                key = repr((
+                    tuple(g['id'] for g in st.session_state.genes),
+                    tuple(p['gene_id'] for p in st.session_state.proteins),
+                ))
+                return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+            # The results UI is split into st.fragment functions so interacting
+            # with one section (typing a sequence name, toggling a widget) doesn't
+            # re-execute the other heavyweight tab bodies on every rerun.
+            @st.fragment
+            def render_save_controls():
+                # Initialize sequence_name variable
+                sequence_name = st.session_state.current_sequence_name if st.session_state.current_sequence_name else "My Sequence"
+
+                # Initialize save_button variable
+                save_button = False
+
                 if not st.session_state.result_saved:
-                    save_button = st.button("Save Results", type="primary")
-                else:
-                    st.success("Saved to Database")
-            
-            # Handle save button click
-            if not st.session_state.result_saved and save_button:
-                # Check for required data
-                if not st.session_state.genes or not st.session_state.proteins:
-                    st.error("Missing analysis data. Cannot save incomplete results.")
+                    # A form batches the name input with the button so typing
+                    # in the name field doesn't rerun the app per keystroke
+                    with st.form("save_form", clear_on_submit=False):
+                        save_col1, save_col2 = st.columns([3, 1])
+                        with save_col1:
+                            sequence_name = st.text_input("Sequence Name for Saving",
+                                                         value=sequence_name)
+                        with save_col2:
+                            save_button = st.form_submit_button("Save Results", type="primary")
                 else:
-                    try:
+                    save_col1, save_col2 = st.columns([3, 1])
+                    with save_col1:
+                        st.info(f"Saved as: {st.session_state.current_sequence_name} ✓")
+                    with save_col2:
+                        st.success("Saved to Database")
+
+                # Handle save button click
+                if not st.session_state.result_saved and save_button:
+                    # Check for required data
+                    if not st.session_state.genes or not st.session_state.proteins:
+                        st.error("Missing analysis data. Cannot save incomplete results.")
+                    elif st.session_state.get('_last_saved_hash') == analysis_content_hash():
+                        # Same payload already written - skip the redundant
+                        # serialization and DB round-trip on double-clicks
+                        st.session_state.result_saved = True
+                        st.info("These results are already saved.")
+                    else:
                         # Make sure summary report is not None
                         summary_report = st.session_state.summary_report or ""
-                        
-                        # Save analysis result to database
-                        result_id = save_analysis_result(
+
+                        # Run the DB write on a background thread so the UI
+                        # doesn't block on the insert
+                        st.session_state.save_future = SAVE_EXECUTOR.submit(
+                            save_analysis_result,
                             sequence_name=sequence_name,
                             sequence_type=st.session_state.current_sequence_type or "raw",
                             genes=st.session_state.genes,
@@ -856,119 +1244,155 @@ def main():
                             recommendations=st.session_state.recommendations,
                             summary_report=summary_report
                         )
-                        
-                        # Update session state
-                        st.session_state.result_saved = True
-                        st.session_state.current_sequence_name = sequence_name
-                        
-                        # Show success message
-                        st.success(f"Results saved successfully! ID: {result_id}")
-                        
-                        # Refresh the page to update the UI
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error saving results: {str(e)}")
-            
-            # Display summary report
-            st.markdown(st.session_state.summary_report)
-            
-            # Create tabs for different result sections
-            tabs = ["Predicted Genes", "Protein Sequences", "Antibiotic Recommendations"]
-            
-            # Add BLAST results tab if using BLAST search
-            if st.session_state.use_blast_search:
-                tabs.append("BLAST Results")
-            
-            # Create the tabs dynamically
-            all_tabs = st.tabs(tabs)
-            
-            # Tab 0: Predicted Genes
-            with all_tabs[0]:
+                        st.session_state.pending_save_name = sequence_name
+                        st.toast("Saving results in background…")
+
+                # Poll the in-flight save and flip the saved flag once done
+                save_future = st.session_state.get('save_future')
+                if save_future is not None:
+                    if save_future.done():
+                        st.session_state.save_future = None
+                        try:
+                            result_id = save_future.result()
+
+                            # Update session state
+                            st.session_state.result_saved = True
+                            st.session_state.current_sequence_name = st.session_state.pop(
+                                'pending_save_name', sequence_name)
+                            st.session_state._last_saved_hash = analysis_content_hash()
+
+                            # Drop the cached history so the new entry shows up
+                            cached_analysis_history.clear()
+
+                            # Show success message
+                            st.success(f"Results saved successfully! ID: {result_id}")
+
+                            # Refresh only the save controls - the tab content
+                            # is unchanged, so a full-app rerun is wasted work
+                            st.rerun(scope="fragment")
+                        except Exception as e:
+                            st.error(f"Error saving results: {str(e)}")
+                    else:
+                        # Re-check shortly; only this fragment reruns while
+                        # the write completes in the background
+                        st.caption("Saving results…")
+                        time.sleep(0.2)
+                        st.rerun(scope="fragment")
+
+            @st.fragment
+            def render_genes_tab():
                 st.header("Predicted AMR Genes")
-                
-                if st.session_state.genes:
-                    # Convert to DataFrame for display
-                    genes_df = pd.DataFrame(st.session_state.genes)
-                    
-                    # Sample GI IDs to use for demonstration (these would normally come from your sequence data)
-                    sample_ids = [
-                        "gi|2949256985|gb|PV357209.1|",
-                        "gi|2955779261|gb|CP186947.1|",
-                        "gi|2907303961|gb|CP180162.1|",
-                        "gi|2944053110|gb|CP185129.1|",
-                        "gi|2944072299|gb|CP185207.1|",
-                        "gi|2957198048|gb|CP187245.1|",
-                        "gi|2936382141|gb|CP127996.1|",
-                        "gi|2929938784|gb|CP184032.1|",
-                        "gi|2955378441|gb|CP186876.1|",
-                        "gi|2944049663|gb|CP185092.1|"
-                    ]
-                    
-                    # Use OpenAI to identify organisms from the accession IDs
-                    organism_info = {}
-                    for i, seq_id in enumerate(sample_ids):
-                        if i < len(genes_df):
-                            # Get organism info for each sequence ID
-                            info = identify_organism_from_accession(seq_id)
-                            organism_info[i] = info
-                    
-                    # Map organism information to genes dataframe
-                    genes_df['organism'] = genes_df.index.map(
-                        lambda idx: organism_info.get(idx, {}).get('organism', 'Unknown species')
-                    )
-                    
-                    # Map antibiotic resistance information
-                    genes_df['potential_resistance'] = genes_df.index.map(
-                        lambda idx: organism_info.get(idx, {}).get('potential_resistance', 'Unknown')
+
+                # Bind once per render - each proxy attribute access goes
+                # through SessionStateProxy.__getattr__
+                genes = st.session_state.genes
+                if genes:
+                    # Convert to DataFrame for display (cached per analysis)
+                    genes_df = records_to_df(genes).copy()
+
+                    # Use OpenAI to identify organisms from the accession IDs,
+                    # then attach both columns in one vectorized align instead
+                    # of a Python lambda per row
+                    n = min(len(_SAMPLE_GI_IDS), len(genes_df))
+                    organism_info = pd.DataFrame.from_records(
+                        [identify_organism_from_accession(seq_id) for seq_id in _SAMPLE_GI_IDS[:n]],
+                        index=genes_df.index[:n]
                     )
+                    genes_df['organism'] = organism_info['organism'].reindex(
+                        genes_df.index).fillna('Unknown species')
+                    genes_df['potential_resistance'] = organism_info['potential_resistance'].reindex(
+                        genes_df.index).fillna('Unknown')
                     
                     # Display the DataFrame with organism names and without sequence_name
-                    st.dataframe(genes_df[['organism', 'id', 'name', 'potential_resistance', 'start_pos', 'end_pos', 'confidence']], use_container_width=True)
+                    st.dataframe(genes_df[['organism', 'id', 'name', 'potential_resistance', 'start_pos', 'end_pos', 'confidence']], use_container_width=True, hide_index=True)
                     
                     # Gene visualization
                     st.subheader("Gene Location Visualization")
-                    gene_plot = create_gene_visualization(st.session_state.genes)
-                    st.plotly_chart(gene_plot, use_container_width=True)
+                    gene_plot = build_gene_plot(genes)
+                    st.plotly_chart(gene_plot, use_container_width=True, key="gene_plot")
                 else:
-                    st.info("No AMR genes were detected in the sequence.")
-            
-            # Tab 1: Protein Sequences
-            with all_tabs[1]:
+                    st.info(EMPTY_GENES_MSG)
+
+            @st.fragment
+            def render_proteins_tab():
                 st.header("Protein Sequences")
-                
-                if st.session_state.proteins:
-                    # Display protein sequences
-                    for i, protein in enumerate(st.session_state.proteins):
-                        with st.expander(f"Protein for gene {protein['gene_name']} ({protein['gene_id']})"):
-                            st.markdown(f"**Gene Name:** {protein['gene_name']}")
-                            st.markdown(f"**Gene ID:** {protein['gene_id']}")
-                            st.text_area(f"Protein Sequence {i+1}", protein['protein_sequence'], height=150)
-                            st.markdown(f"**Length:** {len(protein['protein_sequence'])} amino acids")
+
+                proteins = st.session_state.proteins
+                if proteins:
+                    # Materialize the protein records once and iterate the columns
+                    # directly - avoids per-row dict lookups inside the render loop
+                    prot_df = records_to_df(proteins)
+
+                    # One selectbox plus a single detail panel instead of an
+                    # expander (with text area and 3D toggle) per protein -
+                    # widget count stays O(1) as the protein list grows
+                    selected = st.selectbox(
+                        "Protein",
+                        options=range(len(prot_df)),
+                        format_func=lambda i: f"{prot_df['gene_name'].iloc[i]} ({prot_df['gene_id'].iloc[i]})"
+                    )
+                    gene_name = prot_df['gene_name'].iloc[selected]
+                    gene_id = prot_df['gene_id'].iloc[selected]
+                    protein_seq = prot_df['protein_sequence'].iloc[selected]
+
+                    st.markdown(
+                        f"**Gene Name:** {gene_name}\n\n"
+                        f"**Gene ID:** {gene_id}\n\n"
+                        f"**Length:** {len(protein_seq)} amino acids"
+                    )
+                    st.text_area("Protein Sequence", protein_seq, height=150,
+                                 key=f"protein_seq_{selected}")
+                    # The 3D viewer (PDB fetch + JS payload) stays behind an
+                    # explicit toggle; the viewer itself is cached per gene
+                    # as a resource. The import sits here too - py3Dmol and
+                    # stmol are only paid for when a structure is requested
+                    if st.toggle("Load 3D structure", key=f"protein_3d_{selected}"):
+                        from utils.protein_3d import render_protein_3d
+                        pdb_id = render_protein_3d(gene_name)
+                        st.caption(f"PDB ID: {pdb_id} (representative structure)")
                     
                     # Protein domain visualization
                     st.subheader("Protein Domain Analysis")
-                    protein_plot = create_protein_domain_plot(st.session_state.proteins)
-                    st.plotly_chart(protein_plot, use_container_width=True)
+                    protein_plot = build_protein_domain_plot(proteins)
+                    st.plotly_chart(protein_plot, use_container_width=True, key="protein_domain_plot")
                 else:
-                    st.info("No protein sequences were generated.")
-            
-    
-            
-            # Tab 2: Antibiotic Recommendations
-            with all_tabs[2]:
+                    st.info(EMPTY_PROTEINS_MSG)
+
+            @st.fragment
+            def render_resistance_tab():
+                st.header("Resistance Profile")
+
+                resistance_data = st.session_state.resistance_data
+                if resistance_data:
+                    # Display the projected view (materialized once per analysis)
+                    resistance_view = project_view(
+                        resistance_data,
+                        ('sequence_name', 'gene_name', 'antibiotic', 'resistance_level', 'mechanism')
+                    )
+                    st.dataframe(resistance_view, use_container_width=True, hide_index=True)
+
+                    # Resistance heatmap
+                    st.subheader("Resistance Heatmap")
+                    heatmap = build_resistance_heatmap(resistance_data)
+                    st.plotly_chart(heatmap, use_container_width=True, key="resistance_heatmap")
+
+                    # Resistance mechanism distribution
+                    st.subheader("Resistance Mechanisms")
+                    fig = build_mechanism_pie(resistance_data)
+                    st.plotly_chart(fig, use_container_width=True, key="mechanism_pie")
+                else:
+                    st.info(EMPTY_RESISTANCE_MSG)
+
+            @st.fragment
+            def render_recommendations_tab():
                 st.header("Antibiotic Recommendations")
                 
-                if st.session_state.recommendations:
-                    # Separate effective and ineffective antibiotics
-                    effective = []
-                    ineffective = []
-                    
-                    for rec in st.session_state.recommendations:
-                        if rec['effective']:
-                            effective.append(rec)
-                        else:
-                            ineffective.append(rec)
-                    
+                recommendations = st.session_state.recommendations
+                if recommendations:
+                    # Separate effective and ineffective antibiotics into
+                    # display-ready views (partitioned once per analysis)
+                    effective_df, ineffective_df = recommendation_views(recommendations)
+
                     # Display effective antibiotics with medical styling
                     st.markdown("""
                     <div style="background-color: #f0fff0; padding: 15px; border-radius: 8px; border-left: 5px solid #4caf50; margin-bottom: 15px;">
@@ -977,21 +1401,12 @@ def main():
                     </div>
                     """, unsafe_allow_html=True)
                     
-                    if effective:
-                        effective_df = pd.DataFrame(effective)
-                        st.dataframe(effective_df[['antibiotic', 'confidence', 'rationale']], use_container_width=True)
-                        
+                    if not effective_df.empty:
+                        st.dataframe(effective_df, use_container_width=True, hide_index=True)
+
                         # Visualize effectiveness confidence
-                        fig = px.bar(
-                            effective_df, 
-                            x='antibiotic', 
-                            y='confidence',
-                            title='Confidence in Antibiotic Effectiveness',
-                            labels={'antibiotic': 'Antibiotic', 'confidence': 'Confidence Score (0-1)'},
-                            color='confidence',
-                            color_continuous_scale='Viridis',
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
+                        fig = build_confidence_bar(effective_df, 'Confidence in Antibiotic Effectiveness', 'Viridis')
+                        st.plotly_chart(fig, use_container_width=True, key="effective_bar")
                     else:
                         st.warning("No effective antibiotics found based on the resistance profile.")
                     
@@ -1003,178 +1418,253 @@ def main():
                     </div>
                     """, unsafe_allow_html=True)
                     
-                    if ineffective:
-                        ineffective_df = pd.DataFrame(ineffective)
-                        st.dataframe(ineffective_df[['antibiotic', 'confidence', 'rationale']], use_container_width=True)
-                        
+                    if not ineffective_df.empty:
+                        st.dataframe(ineffective_df, use_container_width=True, hide_index=True)
+
                         # Add visualization for ineffective antibiotics
-                        if len(ineffective) > 1:
-                            fig = px.bar(
-                                ineffective_df, 
-                                x='antibiotic', 
-                                y='confidence',
-                                title='Confidence in Antibiotic Ineffectiveness',
-                                labels={'antibiotic': 'Antibiotic', 'confidence': 'Confidence Score (0-1)'},
-                                color='confidence',
-                                color_continuous_scale='Reds',
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
+                        if len(ineffective_df) > 1:
+                            fig = build_confidence_bar(ineffective_df, 'Confidence in Antibiotic Ineffectiveness', 'Reds')
+                            st.plotly_chart(fig, use_container_width=True, key="ineffective_bar")
                     else:
                         st.info("No ineffective antibiotics identified.")
                 else:
-                    st.info("No antibiotic recommendations were generated.")
-            
-            # Tab 3: BLAST Results (only shown if using BLAST search)
-            if st.session_state.use_blast_search and len(all_tabs) > 3:
-                with all_tabs[3]:
-                    st.header("BLAST Search Results")
-                    
-                    if st.session_state.blast_results:
-                        # Overview statistics
-                        st.subheader("Overview")
-                        col1, col2, col3 = st.columns(3)
-                        
-                        with col1:
-                            st.metric("Total Hits", st.session_state.blast_results.get('total_hits', 0))
-                        
-                        with col2:
-                            num_classes = len(st.session_state.blast_results.get('hits_by_class', {}))
-                            st.metric("Resistance Classes", num_classes)
-                        
-                        with col3:
-                            num_antibiotics = len(st.session_state.blast_results.get('antibiotic_effectiveness', {}))
-                            st.metric("Antibiotics Analyzed", num_antibiotics)
-                        
-                        # Resistance classes bar chart
-                        st.subheader("Resistance Genes by Class")
-                        hits_by_class = st.session_state.blast_results.get('hits_by_class', {})
-                        
-                        if hits_by_class:
-                            class_counts = {k: len(v) for k, v in hits_by_class.items()}
-                            class_df = pd.DataFrame({
-                                'Class': [k.replace('_', ' ').title() for k in class_counts.keys()],
-                                'Count': list(class_counts.values())
-                            })
-                            
-                            fig = px.bar(
-                                class_df,
-                                x='Class',
-                                y='Count',
-                                title='Resistance Genes Detected by Class',
-                                color='Count',
-                                color_continuous_scale='Reds'
-                            )
-                            st.plotly_chart(fig, use_container_width=True)
-                        
-                        # Top hits table
-                        st.subheader("Top Resistance Gene Hits")
-                        all_hits = st.session_state.blast_results.get('all_hits', [])
-                        
-                        if all_hits:
-                            # Create DataFrame with relevant columns
-                            hits_df = pd.DataFrame([{
-                                'Title': hit['title'],
-                                'E-value': hit['e_value'],
-                                'Identity (%)': round(hit['identity'] * 100, 2),
-                                'Length': hit['length'],
-                                'Score': hit['score'],
-                                'Accession': hit['accession']
-                            } for hit in all_hits])
-                            
-                            # Sort by identity (higher is better)
-                            hits_df = hits_df.sort_values('Identity (%)', ascending=False)
-                            
-                            # Display table
-                            st.dataframe(hits_df, use_container_width=True)
-                            
-                            # Show detailed hit information in expanders
-                            st.subheader("Detailed Hit Information")
-                            
-                            for i, hit in enumerate(all_hits[:10]):  # Show top 10 hits only to avoid clutter
-                                with st.expander(f"Hit {i+1}: {hit['title'][:50]}..."):
-                                    st.markdown(f"**Accession:** {hit['accession']}")
-                                    st.markdown(f"**E-value:** {hit['e_value']:.2e}")
-                                    st.markdown(f"**Identity:** {hit['identity']*100:.2f}%")
-                                    st.markdown(f"**Alignment Length:** {hit['length']} bp")
-                                    st.markdown(f"**Query Range:** {hit['query_start']} - {hit['query_end']}")
-                                    
-                                    # Show sequence alignment
-                                    st.subheader("Sequence Alignment")
-                                    alignment_text = f"""
-                                    ```
-                                    Query: {hit['query']}
-                                           {hit['alignment']}
-                                    Sbjct: {hit['sbjct']}
-                                    ```
-                                    """
-                                    st.markdown(alignment_text)
-                                    
-                                    # Get related antibiotics
-                                    related_antibiotics = []
-                                    for antibiotic, data in st.session_state.blast_results.get('antibiotic_effectiveness', {}).items():
-                                        if hit['title'].lower() in data['rationale'].lower():
-                                            effectiveness = "✅ Effective" if data['effective'] else "❌ Not Effective"
-                                            related_antibiotics.append(f"{antibiotic}: {effectiveness} ({data['rationale']})")
-                                    
-                                    if related_antibiotics:
-                                        st.subheader("Related Antibiotics")
-                                        for ab in related_antibiotics:
-                                            st.markdown(f"- {ab}")
-                        else:
-                            st.info("No BLAST hits found. Try lowering the significance threshold or use a different sequence.")
+                    st.info(EMPTY_RECOMMENDATIONS_MSG)
+
+            @st.fragment
+            def render_blast_tab():
+                st.header("BLAST Search Results")
+
+                # Bind the result dict to locals once - each
+                # st.session_state access goes through the state proxy,
+                # and this tab reads it in every section
+                blast_results = st.session_state.blast_results or {}
+                hits_by_class = blast_results.get('hits_by_class', {})
+                all_hits = blast_results.get('all_hits', [])
+                antibiotic_effectiveness = blast_results.get('antibiotic_effectiveness', {})
+
+                if blast_results:
+                    # Overview statistics
+                    st.subheader("Overview")
+                    col1, col2, col3 = st.columns(3)
+
+                    with col1:
+                        st.metric("Total Hits", blast_results.get('total_hits', 0))
+
+                    with col2:
+                        st.metric("Resistance Classes", len(hits_by_class))
+
+                    with col3:
+                        st.metric("Antibiotics Analyzed", len(antibiotic_effectiveness))
+
+                    # Resistance classes bar chart
+                    st.subheader("Resistance Genes by Class")
+
+                    if hits_by_class:
+                        fig = build_class_bar(
+                            {k: len(v) for k, v in hits_by_class.items()}
+                        )
+                        st.plotly_chart(fig, use_container_width=True, key="blast_class_bar")
+
+                    # Top hits table
+                    st.subheader("Top Resistance Gene Hits")
+
+                    if all_hits:
+                        # Display table (cached Arrow table, built once per
+                        # analysis). Only the top slice is shipped to the
+                        # front-end each rerun; the full table is serialized
+                        # only while the toggle is on (expander bodies run
+                        # eagerly, so they wouldn't defer the payload)
+                        hits_table = blast_hits_table(all_hits)
+                        # Scientific notation is applied client-side by the
+                        # column config instead of pre-stringifying the column
+                        hits_column_config = {
+                            'E-value': st.column_config.NumberColumn(format="%.2e")
+                        }
+                        st.dataframe(
+                            hits_table.slice(0, MAX_HITS_TABLE_ROWS),
+                            use_container_width=True, height=400,
+                            column_config=hits_column_config
+                        )
+                        if hits_table.num_rows > MAX_HITS_TABLE_ROWS and st.toggle(
+                                f"Show all {hits_table.num_rows} hits", key="all_hits_table"):
+                            st.dataframe(hits_table, use_container_width=True,
+                                         column_config=hits_column_config)
+
+                        # Show detailed hit information in expanders
+                        st.subheader("Detailed Hit Information")
+
+                        # Lower the rationales once up front; each hit then
+                        # matches against them with a single vectorized
+                        # str.contains scan instead of re-lowering every
+                        # rationale per hit
+                        ab_df = pd.DataFrame([
+                            (ab, data['effective'], data['rationale'], data['rationale'].lower())
+                            for ab, data in antibiotic_effectiveness.items()
+                        ], columns=['antibiotic', 'effective', 'rationale', 'rationale_lower'])
+
+                        def render_hit_details(i, hit):
+                            with st.expander(f"Hit {i+1}: {hit['title'][:50]}..."):
+                                # One markdown call per expander body - the
+                                # stats, alignment and related-antibiotic
+                                # lines are batched into a single element
+                                # instead of half a dozen
+                                parts = [
+                                    f"**Accession:** {hit['accession']}\n\n"
+                                    f"**E-value:** {hit['e_value']:.2e}\n\n"
+                                    f"**Identity:** {hit['identity']*100:.2f}%\n\n"
+                                    f"**Alignment Length:** {hit['length']} bp\n\n"
+                                    f"**Query Range:** {hit['query_start']} - {hit['query_end']}\n\n"
+                                    "#### Sequence Alignment\n"
+                                    "```\n"
+                                    f"Query: {hit['query']}\n"
+                                    f"       {hit['alignment']}\n"
+                                    f"Sbjct: {hit['sbjct']}\n"
+                                    "```"
+                                ]
+
+                                # Get related antibiotics
+                                if not ab_df.empty:
+                                    related = ab_df[ab_df['rationale_lower'].str.contains(
+                                        hit['title'].lower(), regex=False
+                                    )]
+                                    if not related.empty:
+                                        parts.append("\n\n#### Related Antibiotics\n")
+                                        for row in related.itertuples(index=False):
+                                            effectiveness = "✅ Effective" if row.effective else "❌ Not Effective"
+                                            parts.append(f"\n- {row.antibiotic}: {effectiveness} ({row.rationale})")
+
+                                st.markdown(''.join(parts))
+
+                        # Render the first few hits eagerly and the rest only
+                        # on request - each expander body is a dozen frontend
+                        # elements, so the default payload stays small
+                        for i, hit in enumerate(all_hits[:3]):
+                            render_hit_details(i, hit)
+                        if len(all_hits) > 3 and st.toggle("Show more hit details", key="more_hit_details"):
+                            for i, hit in enumerate(all_hits[3:10], start=3):
+                                render_hit_details(i, hit)
                     else:
-                        st.info("No BLAST results available. Run the analysis with BLAST search enabled to see results here.")
+                        st.info(EMPTY_BLAST_HITS_MSG)
+                else:
+                    st.info(EMPTY_BLAST_MSG)
+
+            render_save_controls()
+
+            # Display summary report in its own fragment so the long markdown
+            # block isn't re-sent to the front-end on unrelated interactions.
+            # Long reports are truncated by default - the browser-side
+            # markdown parser is the slow path on multi-KB inputs - with the
+            # remainder revealed on demand.
+            @st.fragment
+            def render_summary_report():
+                report = st.session_state.summary_report or ""
+                if len(report) > MAX_REPORT_CHARS and not st.session_state.get('show_full_report'):
+                    st.markdown(report[:MAX_REPORT_CHARS] + "\n\n…")
+                    if st.button("Show full report"):
+                        st.session_state.show_full_report = True
+                        st.rerun(scope="fragment")
+                else:
+                    st.markdown(report)
+
+            render_summary_report()
+            
+            # Skip building the result tabs entirely when the analysis
+            # produced nothing to show
+            if not (st.session_state.genes or st.session_state.proteins
+                    or st.session_state.resistance_data
+                    or st.session_state.recommendations):
+                st.info(EMPTY_RESULTS_MSG)
+            else:
+                # Result sections. st.tabs evaluates every tab body on each
+                # rerun, building all the figures whether visible or not; a
+                # radio-gated branch builds only the section on screen.
+                tabs = ["Predicted Genes", "Protein Sequences", "Resistance Profile", "Antibiotic Recommendations"]
+
+                # Add BLAST results section if using BLAST search
+                if st.session_state.use_blast_search:
+                    tabs.append("BLAST Results")
+
+                active_tab = st.radio(
+                    "Result section", tabs, horizontal=True,
+                    label_visibility="collapsed", key="active_tab"
+                )
+
+                if active_tab == "Predicted Genes":
+                    render_genes_tab()
+                elif active_tab == "Protein Sequences":
+                    render_proteins_tab()
+                elif active_tab == "Resistance Profile":
+                    render_resistance_tab()
+                elif active_tab == "Antibiotic Recommendations":
+                    render_recommendations_tab()
+                elif active_tab == "BLAST Results":
+                    render_blast_tab()
+
+            # Research assistant chat - its own fragment so sending a
+            # message reruns only this panel, not the result tabs
+            @st.fragment
+            def render_chat_panel():
+                st.subheader("Research Assistant")
+
+                # Concatenate the visible history into one markdown payload:
+                # a single frontend element per rerun instead of one per
+                # message. Contents are escaped before being marked as HTML.
+                history = st.session_state.chat_history or []
+                html_parts = []
+                for message in history:
+                    if message['role'] == 'system':
+                        continue
+                    who = 'You' if message['role'] == 'user' else 'GeneHack Assistant'
+                    body = html.escape(message['content']).replace('\n', '<br>')
+                    html_parts.append(
+                        f"<div style='margin-bottom: 0.75rem;'><strong>{who}:</strong> {body}</div>"
+                    )
+                if html_parts:
+                    st.markdown(''.join(html_parts), unsafe_allow_html=True)
+
+                def submit_chat(message):
+                    with st.spinner("Thinking..."):
+                        result = chat_with_assistant(st.session_state.chat_history, message)
+                    st.session_state.chat_history = result['chat_history']
+                    st.rerun(scope="fragment")
+
+                # Suggested questions for the current analysis (memoized per
+                # payload, so reruns don't re-invoke the LLM)
+                suggestions = cached_suggestions(_dumps_payload({
+                    'genes': st.session_state.genes,
+                    'resistance_data': st.session_state.resistance_data
+                }))
+                # Keys carry the analysis version so widget state from a
+                # previous analysis never bleeds into identically-worded
+                # suggestions for a new one
+                version = st.session_state.analysis_version
+                for question in suggestions.get('suggested_questions', [])[:4]:
+                    digest = hashlib.blake2b(question.encode(), digest_size=8).hexdigest()
+                    if st.button(question, key=f"suggest_{version}_{digest}"):
+                        submit_chat(question)
+
+                # st.chat_input clears itself and scopes the rerun to this
+                # fragment - no form round-trip per message
+                if prompt := st.chat_input("Ask about this analysis"):
+                    submit_chat(prompt.strip())
+
+            if st.session_state.chat_history is not None:
+                render_chat_panel()
         else:
             # Enhanced landing page with modern UI
-            st.markdown("""
-            <div style="text-align: center; padding: 20px 0;">
-                <h1 style="color: #1976d2; font-size: 2.8rem; margin-bottom: 10px;">GeneHack AMR</h1>
-                <p style="color: #666; font-size: 1.2rem; margin-bottom: 25px;">Advanced Antimicrobial Resistance Analysis Platform</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(_HOME_HERO_HTML, unsafe_allow_html=True)
             
             # Add molecule animation to the main page when not analyzing
             col1, col2, col3 = st.columns([1, 2, 1])
             with col2:
+                molecule_animation = load_lottie_url(LOTTIE_URLS['molecule'])
                 if molecule_animation:
                     st_lottie(molecule_animation, speed=1, height=350, key="molecule_animation")
             
-            # Instructions with improved styling
-            st.markdown("""
-            <div style="background-color: #f8f9fa; border-radius: 10px; padding: 20px; margin: 20px 0; border-left: 5px solid #1976d2;">
-                <h3 style="color: #1976d2; margin-top: 0;">Getting Started</h3>
-                <p>Upload a FASTA file or enter a raw genetic sequence in the sidebar and click 'Analyze Sequence' to start your analysis.</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Feature cards in columns
-            st.markdown("<h2 style='text-align: center; color: #333; margin: 30px 0 20px;'>Key Features</h2>", unsafe_allow_html=True)
-            
-            feature_col1, feature_col2, feature_col3 = st.columns(3)
-            
-            with feature_col1:
-                st.markdown("""
-                <div style="background-color: white; border-radius: 8px; padding: 15px; height: 200px; border: 1px solid #e0e0e0; box-shadow: 0 2px 4px rgba(0,0,0,0.05);">
-                    <h3 style="color: #1976d2;">🧬 Gene Prediction</h3>
-                    <p>Identifies genes linked to antimicrobial resistance with organism identification.</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-            with feature_col2:
-                st.markdown("""
-                <div style="background-color: white; border-radius: 8px; padding: 15px; height: 200px; border: 1px solid #e0e0e0; box-shadow: 0 2px 4px rgba(0,0,0,0.05);">
-                    <h3 style="color: #1976d2;">🧪 Protein Analysis</h3>
-                    <p>Converts genes to protein sequences and provides detailed domain analysis.</p>
-                </div>
-                """, unsafe_allow_html=True)
-                
-            with feature_col3:
-                st.markdown("""
-                <div style="background-color: white; border-radius: 8px; padding: 15px; height: 200px; border: 1px solid #e0e0e0; box-shadow: 0 2px 4px rgba(0,0,0,0.05);">
-                    <h3 style="color: #1976d2;">💊 Antibiotic Recommendations</h3>
-                    <p>Suggests which antibiotics might be effective based on the resistance profile.</p>
-                </div>
-                """, unsafe_allow_html=True)
+            # Instructions and feature cards are all static HTML - batch them
+            # into one markdown call, with the cards in a flex row instead of
+            # three st.columns containers
+            st.markdown(_HOME_FEATURES_HTML, unsafe_allow_html=True)
             
             # Example/demo section with improved styling
             # Replace the current expander content with this:
@@ -1183,52 +1673,21 @@ def main():
                 demo_col1, demo_col2 = st.columns([3, 2])
                 
                 with demo_col1:
-                    st.markdown("""
-                    <div style="background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 6px rgba(0,0,0,0.1);">
-                        <h3 style="color: #1976d2; margin-top: 0;">Quick Start Guide</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                    1. **Select input method** in the sidebar: Upload FASTA, paste raw sequence, or load saved  
-                    2. **Click 'Analyze Sequence'** to process the genomic data  
-                    3. **Review results** across the interactive tabs
-                    """)
-                    
-                    st.markdown("""
-                    <div style="background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 6px rgba(0,0,0,0.1); margin-top: 15px;">
-                        <h4 style="color: #1976d2; margin-top: 0;">Results Breakdown</h4>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                    - 🧫 **Predicted Genes** - AMR genes with organism identification  
-                    - 🔬 **Protein Sequences** - Translated proteins with domain analysis  
-                    - 💊 **Antibiotic Recommendations** - Effective treatment options  
-                    - 🔍 **BLAST Results** - Detailed gene matches from databases
-                    """)
-                    
-                    st.markdown("""
-                    <div style="background-color: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 6px rgba(0,0,0,0.1); margin-top: 15px;">
-                        <h4 style="color: #1976d2; margin-top: 0;">Key Capabilities</h4>
-                    </div>
-                    """, unsafe_allow_html=True)
-                    
-                    st.markdown("""
-                    - **Advanced Organism Identification** - Identifies bacterial species from sequence IDs  
-                    - **Resistance Pattern Analysis** - Detects patterns of antimicrobial resistance  
-                    - **Treatment Guidance** - Provides evidence-based antibiotic recommendations  
-                    - **Interactive Visualizations** - Helps understand complex genomic data
-                    """)
+                    # One markdown call for the whole guide column - the HTML
+                    # headers and markdown lists render the same when batched
+                    st.markdown(_QUICK_START_MD, unsafe_allow_html=True)
                     
                 with demo_col2:
+                    laboratory_animation = load_lottie_url(LOTTIE_URLS['laboratory'])
                     if laboratory_animation:
                         st_lottie(laboratory_animation, speed=1, height=300, key="lab_animation")
     
-    # Add footer
-    st.markdown("---")
-    st.markdown("### 🧬 GeneHack AMR")
-    st.markdown("Antimicrobial Resistance Analysis Platform for Bacterial Genomes")
+    # Add footer (single markdown call)
+    st.markdown(
+        "---\n"
+        "### 🧬 GeneHack AMR\n"
+        "Antimicrobial Resistance Analysis Platform for Bacterial Genomes"
+    )
 
 if __name__ == "__main__":
     main()
@@ -5,6 +5,11 @@ Database module for GeneHack AMR - handles database connections and operations.
 import os
 import json
 import datetime
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements
+    orjson = None
 from typing import Dict, List, Any, Optional
 import sqlalchemy as sa
 from sqlalchemy.ext.declarative import declarative_base
@@ -25,6 +30,18 @@ Base = declarative_base()
 if is_postgres:
     from sqlalchemy.dialects.postgresql import JSON, JSONB
 
+def _json_dumps(obj: Any) -> str:
+    """Serialize result payloads for storage (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+def _json_loads(data: str) -> Any:
+    """Deserialize stored result payloads (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class AnalysisResult(Base):
     """Model for storing analysis results."""
     __tablename__ = 'analysis_results'
@@ -59,16 +76,16 @@ class AnalysisResult(Base):
             
             # For SQLite, we need to deserialize the JSON strings
             if not is_postgres and isinstance(genes_data, str):
-                genes = json.loads(genes_data) if genes_data else []
-                proteins = json.loads(proteins_data) if proteins_data else []
-                resistance_data = json.loads(resistance_data_data) if resistance_data_data else []
-                recommendations = json.loads(recommendations_data) if recommendations_data else []
+                genes = _json_loads(genes_data) if genes_data else []
+                proteins = _json_loads(proteins_data) if proteins_data else []
+                resistance_data = _json_loads(resistance_data_data) if resistance_data_data else []
+                recommendations = _json_loads(recommendations_data) if recommendations_data else []
             else:
                 genes = genes_data
                 proteins = proteins_data
                 resistance_data = resistance_data_data
                 recommendations = recommendations_data
-        except (TypeError, json.JSONDecodeError):
+        except (TypeError, ValueError):
             # Fallback in case of errors
             genes = []
             proteins = []
@@ -144,10 +161,10 @@ def save_analysis_result(
     try:
         # For SQLite, convert data to JSON strings
         if not is_postgres:
-            genes_json = json.dumps(genes)
-            proteins_json = json.dumps(proteins)
-            resistance_data_json = json.dumps(resistance_data)
-            recommendations_json = json.dumps(recommendations)
+            genes_json = _json_dumps(genes)
+            proteins_json = _json_dumps(proteins)
+            resistance_data_json = _json_dumps(resistance_data)
+            recommendations_json = _json_dumps(recommendations)
         else:
             genes_json = genes
             proteins_json = proteins
@@ -305,10 +322,3 @@ def get_stored_sequences(limit: int = 10) -> List[Dict[str, Any]]:
     
     finally:
         session.close()
-
-# Create tables on module import
-try:
-    create_tables()
-    print("Database tables created successfully")
-except Exception as e:
-    print(f"Error creating database tables: {e}")
\ No newline at end of file
@@ -49,42 +49,94 @@ def get_pdb_structure(gene_name):
     # Return a fallback structure
     return random.choice(FALLBACK_PDB_IDS)
 
-def render_protein_3d(gene_name, container=None):
+@st.cache_resource(show_spinner=False)
+def _load_structure_view(gene_name):
     """
-    Render a 3D protein structure visualization.
-    
+    Build the py3Dmol viewer for a gene's representative structure.
+
+    The viewer object is not serializable, so it is cached as a shared
+    resource keyed on the gene name - reruns reuse the same viewer instead
+    of re-fetching and re-parsing the PDB structure.
+
     Args:
         gene_name: Name of the gene
-        container: Optional Streamlit container to render in
-        
+
     Returns:
-        None - displays the visualization
+        Tuple of (py3Dmol view, PDB ID)
     """
     pdb_id = get_pdb_structure(gene_name)
-    
+
     # Initialize the viewer
     view = py3Dmol.view(width=500, height=400)
-    
+
     # Fetch the protein structure
     view.addModel(f'https://files.rcsb.org/download/{pdb_id}.pdb', 'pdb')
-    
+
     # Style the protein
     view.setStyle({'cartoon': {'color': 'spectrum', 'thickness': 1.0}})
     view.addStyle({'hetflag': True}, {'stick': {'radius': 0.2, 'opacity': 0.9, 'color': 'white'}})
     view.addSurface(py3Dmol.VDW, {'opacity': 0.7, 'color': 'white'})
-    
+
     # Zoom to fit
     view.zoomTo()
-    
+
+    return view, pdb_id
+
+def render_protein_3d(gene_name, container=None):
+    """
+    Render a 3D protein structure visualization.
+
+    Args:
+        gene_name: Name of the gene
+        container: Optional Streamlit container to render in
+
+    Returns:
+        None - displays the visualization
+    """
+    view, pdb_id = _load_structure_view(gene_name)
+
     # Render in the provided container or directly
     if container:
         with container:
             showmol(view, height=400, width=500)
     else:
         showmol(view, height=400, width=500)
-    
+
     return pdb_id
 
+@st.cache_data(show_spinner=False)
+def _aa_composition(seq):
+    """
+    Compute the amino acid composition breakdown for a protein sequence.
+
+    Args:
+        seq: Protein sequence string
+
+    Returns:
+        DataFrame with Property/Percentage columns
+    """
+    total_aa = len(seq)
+
+    # Group amino acids by properties
+    hydrophobic = ['A', 'V', 'I', 'L', 'M', 'F', 'Y', 'W']
+    charged = ['K', 'R', 'D', 'E']
+    polar = ['S', 'T', 'N', 'Q', 'C', 'G', 'P', 'H']
+
+    # Count occurrences
+    h_count = sum(seq.count(aa) for aa in hydrophobic)
+    c_count = sum(seq.count(aa) for aa in charged)
+    p_count = sum(seq.count(aa) for aa in polar)
+
+    # Calculate percentages
+    h_pct = (h_count / total_aa) * 100
+    c_pct = (c_count / total_aa) * 100
+    p_pct = (p_count / total_aa) * 100
+
+    return pd.DataFrame({
+        'Property': ['Hydrophobic', 'Charged', 'Polar'],
+        'Percentage': [h_pct, c_pct, p_pct]
+    })
+
 def create_interactive_protein_view(protein_info, container=None):
     """
     Create an interactive protein view with information about the protein.
@@ -114,32 +166,10 @@ def create_interactive_protein_view(protein_info, container=None):
             
             # Display sequence info
             st.markdown("**Amino Acid Composition:**")
-            
-            # Calculate amino acid composition
+
+            # Calculate amino acid composition (memoized on the sequence)
             seq = protein_info['protein_sequence']
-            total_aa = len(seq)
-            
-            # Group amino acids by properties
-            hydrophobic = ['A', 'V', 'I', 'L', 'M', 'F', 'Y', 'W']
-            charged = ['K', 'R', 'D', 'E']
-            polar = ['S', 'T', 'N', 'Q', 'C', 'G', 'P', 'H']
-            
-            # Count occurrences
-            h_count = sum(seq.count(aa) for aa in hydrophobic)
-            c_count = sum(seq.count(aa) for aa in charged)
-            p_count = sum(seq.count(aa) for aa in polar)
-            
-            # Calculate percentages
-            h_pct = (h_count / total_aa) * 100
-            c_pct = (c_count / total_aa) * 100
-            p_pct = (p_count / total_aa) * 100
-            
-            # Create composition chart
-            data = {
-                'Property': ['Hydrophobic', 'Charged', 'Polar'],
-                'Percentage': [h_pct, c_pct, p_pct]
-            }
-            chart_df = pd.DataFrame(data)
+            chart_df = _aa_composition(seq)
             
             # Show the chart
             fig = px.bar(
@@ -154,7 +184,7 @@ def create_interactive_protein_view(protein_info, container=None):
             st.plotly_chart(fig, use_container_width=True)
             
             # Display sequence length
-            st.markdown(f"**Sequence Length:** {total_aa} amino acids")
+            st.markdown(f"**Sequence Length:** {len(seq)} amino acids")
             
             # Display a snippet of the sequence
             st.markdown("**Sequence Preview:**")
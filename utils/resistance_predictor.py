@@ -1,3 +1,4 @@
+import functools
 import json
 import random
 from typing import List, Dict, Any, Optional
@@ -5,14 +6,26 @@ from typing import List, Dict, Any, Optional
 def analyze_protein_resistance(protein_sequence: str, gene_name: str) -> List[Dict[str, Any]]:
     """
     Analyze a protein sequence for antimicrobial resistance markers.
-    
+
+    Results are memoized on (protein_sequence, gene_name); the JSON
+    round-trip hands every caller an independent copy, so downstream code
+    can annotate the records without corrupting the cache.
+
     Args:
         protein_sequence: The protein sequence to analyze
         gene_name: The name of the gene this protein is from
-        
+
     Returns:
         List of dictionaries containing resistance information
     """
+    return json.loads(_analyze_protein_resistance_json(protein_sequence, gene_name))
+
+@functools.lru_cache(maxsize=8192)
+def _analyze_protein_resistance_json(protein_sequence: str, gene_name: str) -> str:
+    """Memoized JSON form of the resistance analysis."""
+    return json.dumps(_analyze_protein_resistance(protein_sequence, gene_name))
+
+def _analyze_protein_resistance(protein_sequence: str, gene_name: str) -> List[Dict[str, Any]]:
     # In a real implementation, this would use a trained ML model and database comparison
     
     # Mapping of gene types to potential resistance information
@@ -3,6 +3,7 @@ Sequence identifier module for mapping NCBI sequence IDs to organism names and o
 """
 import os
 import re
+import types
 import streamlit as st
 from typing import Dict, Any, List
 from openai import OpenAI
@@ -14,6 +15,22 @@ from openai import OpenAI
 OPENAI_API_KEY = st.secrets["OPENAI_API_KEY"]
 client = OpenAI(api_key=st.secrets["OPENAI_API_KEY"])
 
+# Base mapping for known AMR genes to organisms, frozen once at import -
+# read-only and shared across calls instead of a fresh dict literal per call
+_BASE_ORGANISM_MAPPING = types.MappingProxyType({
+    'mecA': 'Staphylococcus aureus',
+    'vanA': 'Enterococcus faecium',
+    'tetM': 'Multiple species',
+    'blaTEM': 'Escherichia coli',
+    'blaCTX-M': 'Enterobacteriaceae',
+    'blaKPC': 'Klebsiella pneumoniae',
+    'blaNDM': 'Enterobacteriaceae',
+    'qnrA': 'Enterobacteriaceae',
+    'qnrS': 'Enterobacteriaceae',
+    'aac': 'Multiple species',
+    'ermB': 'Streptococcus species'
+})
+
 def identify_organism_from_accession(accession_id: str) -> Dict[str, str]:
     """
     Identify organism name and characteristics from NCBI accession ID using OpenAI.
@@ -91,21 +108,8 @@ def get_organism_mapping(gene_names: List[str], sequence_ids: List[str] = []) ->
     Returns:
         Dictionary mapping gene names to organism names
     """
-    # Base mapping for known AMR genes to organisms
-    base_mapping = {
-        'mecA': 'Staphylococcus aureus',
-        'vanA': 'Enterococcus faecium',
-        'tetM': 'Multiple species',
-        'blaTEM': 'Escherichia coli',
-        'blaCTX-M': 'Enterobacteriaceae',
-        'blaKPC': 'Klebsiella pneumoniae',
-        'blaNDM': 'Enterobacteriaceae',
-        'qnrA': 'Enterobacteriaceae',
-        'qnrS': 'Enterobacteriaceae',
-        'aac': 'Multiple species',
-        'ermB': 'Streptococcus species'
-    }
-    
+    base_mapping = _BASE_ORGANISM_MAPPING
+
     # If sequence IDs are provided, enhance the mapping with OpenAI identifications
     sequence_info = {}
     if sequence_ids:
@@ -1,9 +1,24 @@
 import re
 from typing import List, Tuple, Dict, Any, Optional
 import random
-from Bio.Seq import Seq
-from Bio import SeqIO
-from io import StringIO
+
+class SequenceHandle:
+    """
+    Shared views of a single DNA sequence.
+
+    The pipeline needs the same genome as str (pattern search, BLAST) and
+    as bytes (validation, slicing for translation); building the handle once
+    means each consumer reuses one encoding instead of re-scanning the
+    sequence itself.
+    """
+    __slots__ = ('s', 'b')
+
+    def __init__(self, sequence: str):
+        self.s = sequence
+        self.b = sequence.encode('ascii')
+
+    def __len__(self) -> int:
+        return len(self.b)
 
 def validate_sequence(sequence: str) -> bool:
     """
@@ -15,35 +30,74 @@ def validate_sequence(sequence: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    # Remove whitespace and convert to uppercase
-    sequence = sequence.strip().upper()
-    
-    # Check if the sequence contains only valid nucleotides
-    return bool(re.match(r'^[ATGC]+$', sequence))
+    # Remove surrounding whitespace
+    try:
+        data = sequence.strip().encode('ascii')
+    except UnicodeEncodeError:
+        return False
+
+    # Deleting every valid nucleotide in one C-level bytes.translate pass
+    # leaves nothing iff the sequence is clean - much faster than a regex
+    # scan for multi-Mb sequences
+    return bool(data) and not data.translate(None, delete=b'ATGCatgc')
 
 def parse_fasta(fasta_content: str) -> List[Tuple[str, str]]:
     """
     Parse FASTA format content and return a list of (sequence_name, sequence) tuples.
-    
+
+    Delegates to parse_fasta_bytes so both entry points share the single
+    bytes-based pass (C-level whitespace stripping, one join per sequence)
+    instead of a SeqIO record loop.
+
     Args:
         fasta_content: String containing FASTA formatted sequences
-        
+
     Returns:
         List of tuples with (sequence_name, sequence)
     """
-    sequences = []
-    
     try:
-        # Parse FASTA using BioPython
-        fasta_handle = StringIO(fasta_content)
-        for record in SeqIO.parse(fasta_handle, "fasta"):
-            seq_str = str(record.seq).upper()
-            # Validate each sequence
-            if validate_sequence(seq_str):
-                sequences.append((record.id, seq_str))
+        return parse_fasta_bytes(fasta_content.encode('utf-8'))
     except Exception as e:
         raise ValueError(f"Error parsing FASTA content: {str(e)}")
-    
+
+def parse_fasta_bytes(data: bytes) -> List[Tuple[str, str]]:
+    """
+    Parse FASTA content directly from raw bytes.
+
+    Only header lines are decoded; sequence bodies stay as bytes until the
+    final join, so whitespace stripping runs through the C-level
+    bytes.translate and peak memory holds a single copy of the payload.
+
+    Args:
+        data: FASTA formatted content as bytes
+
+    Returns:
+        List of tuples with (sequence_name, sequence)
+    """
+    def _finish(name: Optional[str], chunks: List[bytes]) -> None:
+        if name is None or not chunks:
+            return
+        seq = b''.join(chunks).translate(None, delete=b' \t\r\n').upper()
+        seq_str = seq.decode('ascii', 'ignore')
+        # Validate each sequence
+        if validate_sequence(seq_str):
+            sequences.append((name, seq_str))
+
+    sequences: List[Tuple[str, str]] = []
+    name: Optional[str] = None
+    chunks: List[bytes] = []
+
+    for line in data.splitlines():
+        if line.startswith(b'>'):
+            _finish(name, chunks)
+            header = line[1:].strip()
+            # Match SeqIO's record.id: first whitespace-delimited token
+            name = header.split()[0].decode('utf-8', 'replace') if header else ''
+            chunks = []
+        elif name is not None:
+            chunks.append(line)
+
+    _finish(name, chunks)
     return sequences
 
 def predict_amr_genes(sequence: str, sequence_name: str = "Unknown") -> List[Dict[str, Any]]:
@@ -118,25 +172,71 @@ def predict_amr_genes(sequence: str, sequence_name: str = "Unknown") -> List[Dic
     
     return detected_genes
 
+def _build_codon_table() -> Dict[str, str]:
+    """Build the standard genetic code as a plain codon -> amino acid dict."""
+    bases = 'TCAG'
+    amino_acids = 'FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG'
+    table = {}
+    i = 0
+    for b1 in bases:
+        for b2 in bases:
+            for b3 in bases:
+                table[b1 + b2 + b3] = amino_acids[i]
+                i += 1
+    return table
+
+# Precomputed once at import so batch translation avoids re-deriving the
+# genetic code (or constructing a Bio.Seq object) per gene
+_CODON_TABLE = _build_codon_table()
+_CODON_TABLE_BYTES = {codon.encode(): aa for codon, aa in _CODON_TABLE.items()}
+
+def translate_to_proteins_batch(dna_sequences) -> List[str]:
+    """
+    Translate many DNA sequences in one pass over a shared codon table.
+
+    Args:
+        dna_sequences: List of DNA sequences to translate, as str or bytes
+            (bytes input lets callers slice one encoded genome without
+            building a str copy per gene)
+
+    Returns:
+        List of translated protein sequences, in input order
+    """
+    table = _CODON_TABLE_BYTES
+    # BLAST hits cluster on homologous families, so batches often repeat
+    # the same slice - translate each distinct sequence once
+    memo: Dict[bytes, str] = {}
+    proteins = []
+    for seq in dna_sequences:
+        if isinstance(seq, str):
+            seq = seq.encode('ascii')
+        seq = seq.upper()
+        protein = memo.get(seq)
+        if protein is None:
+            residues = [table.get(seq[i:i + 3], 'X') for i in range(0, len(seq) - 2, 3)]
+            # Remove stop codon if present (*)
+            if residues and residues[-1] == '*':
+                residues.pop()
+            protein = ''.join(residues)
+            memo[seq] = protein
+        proteins.append(protein)
+    return proteins
+
 def translate_to_protein(dna_sequence: str) -> str:
     """
-    Translate a DNA sequence to a protein sequence using Biopython.
-    
+    Translate a DNA sequence to a protein sequence.
+
+    Runs over the precomputed codon table rather than building a Bio.Seq
+    object per call, so single-sequence translation shares the fast path
+    used by translate_to_proteins_batch.
+
     Args:
         dna_sequence: The DNA sequence to translate
-        
+
     Returns:
         The translated protein sequence
     """
     try:
-        # Create a Seq object and translate
-        coding_dna = Seq(dna_sequence)
-        protein_sequence = str(coding_dna.translate())
-        
-        # Remove stop codon if present (*)
-        if protein_sequence.endswith('*'):
-            protein_sequence = protein_sequence[:-1]
-            
-        return protein_sequence
+        return translate_to_proteins_batch([dna_sequence])[0]
     except Exception as e:
         raise ValueError(f"Error translating DNA to protein: {str(e)}")
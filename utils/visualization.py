@@ -6,19 +6,45 @@ import random
 from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter
 
+# Upper bounds on the data handed to Plotly. Whole-genome scans can produce
+# thousands of predicted genes/markers, and browser-side rendering scales
+# poorly past a few thousand points - cap the figures at a fixed budget.
+MAX_PLOT_GENES = 2500
+MAX_HEATMAP_ROWS = 200
+MAX_PLOT_PROTEINS = 100
+
+def _downsample_genes(genes: List[Dict[str, Any]], n_out: int = MAX_PLOT_GENES) -> List[Dict[str, Any]]:
+    """
+    Reduce a gene list to at most n_out entries, keeping the highest
+    confidence predictions.
+
+    Args:
+        genes: List of gene dictionaries
+        n_out: Maximum number of genes to keep
+
+    Returns:
+        Possibly reduced list of gene dictionaries
+    """
+    if len(genes) <= n_out:
+        return genes
+    return sorted(genes, key=lambda g: g.get('confidence', 0), reverse=True)[:n_out]
+
 def create_gene_visualization(genes: List[Dict[str, Any]]) -> go.Figure:
     """
     Create a visualization of gene locations within sequences.
-    
+
     Args:
         genes: List of gene dictionaries with position information
-        
+
     Returns:
         Plotly figure object
     """
     if not genes:
         return go.Figure()
-    
+
+    # Cap the number of rendered genes so browser render time stays bounded
+    genes = _downsample_genes(genes)
+
     # Prepare data for visualization
     data = []
     for gene in genes:
@@ -33,45 +59,52 @@ def create_gene_visualization(genes: List[Dict[str, Any]]) -> go.Figure:
         })
     
     df = pd.DataFrame(data)
-    
+
     # Group by sequence name
     sequences = df['sequence_name'].unique()
-    
+    seq_row = {name: i for i, name in enumerate(sequences)}
+
     fig = go.Figure()
-    
+
     # Color scale
     colors = px.colors.qualitative.Plotly
-    
-    for i, seq_name in enumerate(sequences):
-        seq_genes = df[df['sequence_name'] == seq_name]
-        
-        # Add a line representing the sequence
-        max_pos = seq_genes['end_pos'].max()
-        
-        # Add sequence line
-        fig.add_trace(go.Scatter(
-            x=[0, max_pos],
-            y=[i, i],
+
+    # All sequence backbones in a single trace - the None sentinels break
+    # the line between sequences without adding a trace per row
+    max_pos = df.groupby('sequence_name')['end_pos'].max()
+    backbone_x: List[Any] = []
+    backbone_y: List[Any] = []
+    for seq_name, i in seq_row.items():
+        backbone_x += [0, max_pos[seq_name], None]
+        backbone_y += [i, i, None]
+    fig.add_trace(go.Scattergl(
+        x=backbone_x,
+        y=backbone_y,
+        mode='lines',
+        line=dict(color='gray', width=2),
+        hoverinfo='skip'
+    ))
+
+    # Gene segments bucketed by palette color: one trace per color instead
+    # of one per gene, so thousands of genes stay a handful of traces
+    buckets: Dict[int, Tuple[list, list, list]] = {}
+    for gene in df.itertuples(index=False):
+        color_idx = hash(gene.gene_name) % len(colors)
+        xs, ys, texts = buckets.setdefault(color_idx, ([], [], []))
+        y = seq_row[gene.sequence_name]
+        text = f"Gene: {gene.gene_name}<br>ID: {gene.gene_id}<br>Length: {gene.length} bp<br>Confidence: {gene.confidence}"
+        xs += [gene.start_pos, gene.end_pos, None]
+        ys += [y, y, None]
+        texts += [text, text, None]
+    for color_idx, (xs, ys, texts) in buckets.items():
+        fig.add_trace(go.Scattergl(
+            x=xs,
+            y=ys,
             mode='lines',
-            line=dict(color='gray', width=2),
-            name=seq_name,
-            hoverinfo='name'
+            line=dict(color=colors[color_idx], width=10),
+            text=texts,
+            hoverinfo='text'
         ))
-        
-        # Add genes as markers/segments
-        for _, gene in seq_genes.iterrows():
-            color_idx = hash(gene['gene_name']) % len(colors)
-            
-            # Add gene segment
-            fig.add_trace(go.Scatter(
-                x=[gene['start_pos'], gene['end_pos']],
-                y=[i, i],
-                mode='lines',
-                line=dict(color=colors[color_idx], width=10),
-                name=f"{gene['gene_name']} ({gene['gene_id']})",
-                text=f"Gene: {gene['gene_name']}<br>ID: {gene['gene_id']}<br>Length: {gene['length']} bp<br>Confidence: {gene['confidence']}",
-                hoverinfo='text'
-            ))
     
     # Update layout
     fig.update_layout(
@@ -102,16 +135,20 @@ def create_resistance_heatmap(resistance_data: List[Dict[str, Any]]) -> go.Figur
     if not resistance_data:
         return go.Figure()
     
-    # Convert resistance levels to numeric values
-    resistance_values = {'low': 1, 'medium': 2, 'high': 3}
-    
+    # Convert resistance levels to numeric values. Levels arrive as
+    # 'low'/'medium'/'high' from the fallback predictor but as
+    # 'Low'/'Moderate'/'High' from the BLAST pipeline, so match
+    # case-insensitively and treat Moderate as medium
+    resistance_values = {'low': 1, 'medium': 2, 'moderate': 2, 'high': 3}
+
     # Prepare data for heatmap
     data = []
     for item in resistance_data:
         data.append({
             'gene_name': item['gene_name'],
             'antibiotic': item['antibiotic'],
-            'resistance_level': resistance_values.get(item.get('resistance_level', 'low'), 0),
+            'resistance_level': resistance_values.get(
+                str(item.get('resistance_level', 'low')).lower(), 0),
             'mechanism': item.get('mechanism', 'Unknown'),
         })
     
@@ -124,7 +161,13 @@ def create_resistance_heatmap(resistance_data: List[Dict[str, Any]]) -> go.Figur
         values='resistance_level',
         aggfunc='max'  # Take maximum resistance level if duplicates
     ).fillna(0)
-    
+
+    # Cap the number of heatmap rows, keeping the genes with the strongest
+    # overall resistance signal
+    if len(pivot_table.index) > MAX_HEATMAP_ROWS:
+        top_genes = pivot_table.sum(axis=1).nlargest(MAX_HEATMAP_ROWS).index
+        pivot_table = pivot_table.loc[top_genes]
+
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
         z=pivot_table.values,
@@ -171,7 +214,11 @@ def create_protein_domain_plot(proteins: List[Dict[str, Any]]) -> go.Figure:
     """
     if not proteins:
         return go.Figure()
-    
+
+    # Each protein adds a row (and several traces) to the figure - cap it
+    # so whole-genome runs don't produce an unrenderable plot
+    proteins = proteins[:MAX_PLOT_PROTEINS]
+
     # For a real implementation, this would analyze the protein sequences
     # to identify domains, motifs, and functional regions
     
@@ -224,7 +271,7 @@ def create_protein_domain_plot(proteins: List[Dict[str, Any]]) -> go.Figure:
             })
         
         # Add protein backbone
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=[0, protein_length],
             y=[i, i],
             mode='lines',
@@ -238,7 +285,7 @@ def create_protein_domain_plot(proteins: List[Dict[str, Any]]) -> go.Figure:
             color_idx = hash(domain['type']) % len(colors)
             
             # Add domain as a colored segment
-            fig.add_trace(go.Scatter(
+            fig.add_trace(go.Scattergl(
                 x=[domain['start'], domain['end']],
                 y=[i, i],
                 mode='lines',
@@ -254,7 +301,7 @@ def create_protein_domain_plot(proteins: List[Dict[str, Any]]) -> go.Figure:
             break
             
         # Add invisible trace just for the legend
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=[None],
             y=[None],
             mode='lines',